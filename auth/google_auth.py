@@ -1,6 +1,7 @@
 # auth/google_auth.py
 
 import asyncio
+import functools
 import json
 import jwt
 import logging
@@ -12,7 +13,8 @@ from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import Flow
 from google.auth.transport.requests import Request
 from google.auth.exceptions import RefreshError
-from googleapiclient.discovery import build
+from googleapiclient import discovery_cache
+from googleapiclient.discovery import build, build_from_document
 from googleapiclient.errors import HttpError
 from auth.scopes import SCOPES
 from auth.oauth21_session_store import get_oauth21_session_store
@@ -711,7 +713,7 @@ def get_user_info(credentials: Credentials) -> Optional[Dict[str, Any]]:
     try:
         # Using googleapiclient discovery to get user info
         # Requires 'google-api-python-client' library
-        service = build("oauth2", "v2", credentials=credentials)
+        service = build_service("oauth2", "v2", credentials)
         user_info = service.userinfo().get().execute()
         logger.info(f"Successfully fetched user info: {user_info.get('email')}")
         return user_info
@@ -735,6 +737,31 @@ class GoogleAuthenticationError(Exception):
         self.auth_url = auth_url
 
 
+@functools.lru_cache(maxsize=None)
+def _get_discovery_document(service_name: str, version: str) -> Optional[str]:
+    """
+    Read the bundled static discovery document for an API once per process.
+
+    The raw JSON string is cached rather than a parsed dict: build_from_document
+    mutates a dict passed to it in place, so each service parses its own copy.
+    """
+    return discovery_cache.get_static_doc(service_name, version) or None
+
+
+def build_service(service_name: str, version: str, credentials) -> Any:
+    """
+    Build an authorized Google API service.
+
+    Equivalent to build(service_name, version, credentials=credentials), but the
+    discovery document is read from disk once and reused, since tools build a fresh
+    service on every call. Falls back to build() for APIs without a bundled document.
+    """
+    document = _get_discovery_document(service_name, version)
+    if document is None:
+        return build(service_name, version, credentials=credentials)
+    return build_from_document(document, credentials=credentials)
+
+
 async def get_authenticated_google_service(
     service_name: str,  # "gmail", "calendar", "drive", "docs"
     version: str,  # "v1", "v3"
@@ -838,7 +865,7 @@ async def get_authenticated_google_service(
         raise GoogleAuthenticationError(auth_response)
 
     try:
-        service = build(service_name, version, credentials=credentials)
+        service = build_service(service_name, version, credentials)
         log_user_email = user_google_email
 
         # Try to get email from credentials if needed for validation
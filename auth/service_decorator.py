@@ -5,9 +5,8 @@ from functools import wraps
 from typing import Dict, List, Optional, Any, Callable, Union, Tuple
 
 from google.auth.exceptions import RefreshError
-from googleapiclient.discovery import build
 from fastmcp.server.dependencies import get_context
-from auth.google_auth import get_authenticated_google_service, GoogleAuthenticationError
+from auth.google_auth import build_service, get_authenticated_google_service, GoogleAuthenticationError
 from auth.oauth21_session_store import get_oauth21_session_store
 from auth.oauth_config import is_oauth21_enabled, get_oauth_config
 from core.context import set_fastmcp_session_id
@@ -242,7 +241,7 @@ async def get_authenticated_google_service_oauth21(
 
     logger.debug(f"[{tool_name}] Building Google API service...")
     # Build service
-    service = build(service_name, version, credentials=credentials)
+    service = build_service(service_name, version, credentials)
     logger.info(f"[{tool_name}] Authenticated {service_name} for {user_google_email}")
 
     return service, user_google_email
@@ -439,6 +438,11 @@ def require_google_service(
         # Create a new signature for the wrapper that excludes the 'service' parameter.
         # This is the signature that FastMCP will see.
         wrapper_sig = original_sig.replace(parameters=params[1:])
+        wrapper_params = list(wrapper_sig.parameters.keys())
+
+        # Scope names are fixed per decorated tool, so resolve them once here
+        # rather than on every call
+        resolved_scopes = _resolve_scopes(scopes)
 
         @wraps(func)
         async def wrapper(*args, **kwargs):
@@ -468,8 +472,6 @@ def require_google_service(
             service_version = version or config["version"]
             logger.debug(f"[{tool_name}] Service config: {service_name} v{service_version}")
 
-            # Resolve scopes
-            resolved_scopes = _resolve_scopes(scopes)
             logger.debug(f"[{tool_name}] Resolved scopes: {len(resolved_scopes)} scopes")
 
             try:
@@ -494,7 +496,6 @@ def require_google_service(
 
                 # Override user_google_email with authenticated user when using OAuth 2.1
                 logger.debug(f"[{tool_name}] Checking email override...")
-                wrapper_params = list(wrapper_sig.parameters.keys())
                 user_google_email, args = _override_oauth21_user_email(
                     use_oauth21,
                     authenticated_user,
@@ -586,12 +587,15 @@ def require_multiple_services(service_configs: List[Dict[str, Any]]):
         # Create a new signature excluding service parameters
         wrapper_params = [p for p in original_params if p.name not in service_param_names]
         wrapper_sig = original_sig.replace(parameters=wrapper_params)
+        param_names = list(original_sig.parameters.keys())
+
+        # Scope names are fixed per service config, so resolve them once here
+        # rather than on every call
+        resolved_scopes_per_config = [_resolve_scopes(config["scopes"]) for config in service_configs]
         
         @wraps(func)
         async def wrapper(*args, **kwargs):
             # Extract user_google_email
-            sig = inspect.signature(func)
-            param_names = list(sig.parameters.keys())
 
             user_google_email = None
             if "user_google_email" in kwargs:
@@ -608,9 +612,8 @@ def require_multiple_services(service_configs: List[Dict[str, Any]]):
                 raise Exception("user_google_email parameter is required but not found")
 
             # Authenticate all services
-            for config in service_configs:
+            for config, resolved_scopes in zip(service_configs, resolved_scopes_per_config):
                 service_type = config["service_type"]
-                scopes = config["scopes"]
                 param_name = config["param_name"]
                 version = config.get("version")
 
@@ -620,7 +623,6 @@ def require_multiple_services(service_configs: List[Dict[str, Any]]):
                 service_config = SERVICE_CONFIGS[service_type]
                 service_name = service_config["service"]
                 service_version = version or service_config["version"]
-                resolved_scopes = _resolve_scopes(scopes)
 
                 try:
                     tool_name = func.__name__
@@ -0,0 +1,199 @@
+"""
+Async HTTP Transport for Google API Requests
+
+This module executes googleapiclient requests on a shared aiohttp session instead of
+running the blocking httplib2 transport in a worker thread via asyncio.to_thread.
+
+Discovery is still used to build the request (URL, query, body, headers); only the
+transport is replaced. Responses go through the request's own postproc (JSON bodies are
+parsed with orjson when installed), so callers get the same deserialized objects and the
+same HttpError on non-2xx statuses.
+"""
+
+import asyncio
+import logging
+import urllib.parse
+from typing import Any, Dict, Optional
+
+import aiohttp
+import httplib2
+from google.auth.transport.requests import Request as GoogleAuthRequest
+from googleapiclient.errors import HttpError
+from googleapiclient.http import HttpRequest
+from googleapiclient.model import JsonModel
+
+# orjson is optional; when installed it parses large response pages several times faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+class _FastJsonModel(JsonModel):
+    """JsonModel that (de)serializes with orjson, parsing response bytes without decoding first."""
+
+    def serialize(self, body_value):
+        try:
+            return orjson.dumps(body_value).decode("utf-8")
+        except TypeError:
+            # Values orjson rejects (e.g. integers beyond 64 bits) go through the stdlib
+            return super().serialize(body_value)
+
+    def deserialize(self, content):
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            return super().deserialize(content)
+
+
+_JSON_MODEL = _FastJsonModel(data_wrapper=False) if orjson is not None else JsonModel(data_wrapper=False)
+_JSON_HEADERS = {"accept": "application/json", "accept-encoding": "gzip, deflate"}
+_KEEPALIVE_TIMEOUT_S = 60.0
+
+_session: Optional[aiohttp.ClientSession] = None
+_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_http_session() -> aiohttp.ClientSession:
+    """
+    Get the shared aiohttp session, creating it lazily for the running event loop.
+
+    Returns:
+        aiohttp.ClientSession: Session with a pooled connector reused across tool calls
+    """
+    global _session, _session_loop
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        # Keep idle connections open longer than aiohttp's 15s default so bursts of
+        # tool calls separated by think time reuse TLS connections to googleapis.com
+        connector = aiohttp.TCPConnector(
+            limit=100, ttl_dns_cache=300, keepalive_timeout=_KEEPALIVE_TIMEOUT_S
+        )
+        _session = aiohttp.ClientSession(connector=connector)
+        _session_loop = loop
+        logger.debug("Created shared aiohttp session for Google API requests")
+    return _session
+
+
+async def close_http_session() -> None:
+    """Close the shared aiohttp session, if one was created."""
+    global _session, _session_loop
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+    _session_loop = None
+
+
+async def _ensure_valid_credentials(credentials, force_refresh: bool = False) -> None:
+    """Refresh credentials (blocking google-auth call) only when they are not valid."""
+    if force_refresh or not credentials.valid:
+        await asyncio.to_thread(credentials.refresh, GoogleAuthRequest())
+
+
+async def execute_async(request) -> Any:
+    """
+    Execute a googleapiclient HttpRequest on the shared aiohttp session.
+
+    Falls back to asyncio.to_thread(request.execute) for requests the fast path
+    does not handle (resumable media uploads, or services without google-auth credentials).
+
+    Args:
+        request: An unexecuted googleapiclient HttpRequest (e.g. service.forms().get(formId=...))
+
+    Returns:
+        The deserialized response, exactly as request.execute() would return it
+
+    Raises:
+        HttpError: If the API returns a non-2xx status
+    """
+    credentials = getattr(request.http, "credentials", None)
+    if request.resumable is not None or credentials is None:
+        return await asyncio.to_thread(request.execute)
+
+    session = get_http_session()
+    body = request.body
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+
+    await _ensure_valid_credentials(credentials)
+    for attempt in range(2):
+        headers = dict(request.headers)
+        credentials.apply(headers)
+        async with session.request(
+            request.method, request.uri, data=body, headers=headers
+        ) as resp:
+            content = await resp.read()
+            status = resp.status
+            info = {k.lower(): v for k, v in resp.headers.items()}
+
+        # Mirror google_auth_httplib2: refresh once on 401 and retry
+        if status == 401 and attempt == 0:
+            await _ensure_valid_credentials(credentials, force_refresh=True)
+            continue
+        break
+
+    info["status"] = str(status)
+    http_resp = httplib2.Response(info)
+    for callback in request.response_callbacks:
+        callback(http_resp)
+    if status >= 300:
+        raise HttpError(http_resp, content, uri=request.uri)
+    return _response_postproc(request)(http_resp, content)
+
+
+def _response_postproc(request):
+    """
+    Get the response parser for a request, swapping discovery's stock JsonModel for the
+    orjson-backed one when available. Other models (media, protobuf) are left alone.
+    """
+    model = getattr(request.postproc, "__self__", None)
+    if orjson is not None and type(model) is JsonModel and not model._data_wrapper:
+        return _JSON_MODEL.response
+    return request.postproc
+
+
+def build_api_request(
+    service,
+    path: str,
+    method: str = "GET",
+    query: Optional[Dict[str, Any]] = None,
+    body: Optional[Dict[str, Any]] = None,
+) -> HttpRequest:
+    """
+    Build a JSON HttpRequest from a precomputed path, skipping discovery method dispatch.
+
+    Calling e.g. service.forms().get(...) constructs a fresh Resource and validates
+    arguments against the discovery document on every call. For hot read paths the
+    URL shape is fixed, so this builds the equivalent request directly on the
+    service's authorized http and base URL.
+
+    Args:
+        service: A discovery-built service (used for its authorized http and base URL)
+        path: Path relative to the service base URL, with IDs already quoted (see quote_path_id)
+        method: HTTP method
+        query: Optional query parameters (None values are dropped)
+        body: Optional JSON body
+
+    Returns:
+        HttpRequest: Usable with execute_async() or .execute()
+    """
+    uri = service._baseUrl.rstrip("/") + "/" + path
+    if query:
+        params = {k: v for k, v in query.items() if v is not None}
+        if params:
+            uri += "?" + urllib.parse.urlencode(params)
+    headers = dict(_JSON_HEADERS)
+    payload = None
+    if body is not None:
+        headers["content-type"] = "application/json"
+        payload = _JSON_MODEL.serialize(body)
+    return HttpRequest(
+        service._http, _JSON_MODEL.response, uri, method=method, body=payload, headers=headers
+    )
+
+
+def quote_path_id(value: str) -> str:
+    """Percent-encode an ID for use as a single URL path segment."""
+    return urllib.parse.quote(value, safe="")
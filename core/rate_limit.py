@@ -0,0 +1,115 @@
+"""
+Client-side Rate Limiting for Google API Calls
+
+This module provides per-user async token buckets so concurrent tool calls pace
+themselves below Google's per-user quotas instead of tripping 429s and relying on
+retry/backoff after the fact.
+
+Limiting is opt-in: a service is only paced when WORKSPACE_MCP_<SERVICE>_RATE_LIMIT_PER_MINUTE
+is set (e.g. WORKSPACE_MCP_FORMS_RATE_LIMIT_PER_MINUTE=120). Unset or 0 means unlimited, since
+Google's quotas vary per project and a fixed default would throttle projects with more headroom.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from typing import Tuple
+
+from cachetools import TTLCache
+
+logger = logging.getLogger(__name__)
+
+class AsyncTokenBucket:
+    """
+    Token bucket that refills continuously at `rate_per_minute` and holds up to `burst` tokens.
+
+    Usable either as `await bucket.acquire()` or `async with bucket:` (acquire on entry).
+    """
+
+    def __init__(self, rate_per_minute: float, burst: float = None):
+        self.rate_per_second = rate_per_minute / 60.0
+        self.capacity = burst if burst is not None else max(rate_per_minute, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, tokens: float = 1.0) -> None:
+        """Wait until `tokens` are available, then consume them."""
+        if self.rate_per_second <= 0:
+            return
+        # The lock keeps waiters FIFO so one caller can't starve the others
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate_per_second
+                )
+                self._updated = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                await asyncio.sleep((tokens - self._tokens) / self.rate_per_second)
+
+    async def __aenter__(self) -> "AsyncTokenBucket":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        return None
+
+
+class _NoLimit:
+    """Stand-in used when a service has no configured limit."""
+
+    async def acquire(self, tokens: float = 1.0) -> None:
+        return None
+
+    async def __aenter__(self) -> "_NoLimit":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        return None
+
+
+_NO_LIMIT = _NoLimit()
+
+# Buckets for idle users are dropped after an hour; a fresh bucket starts full anyway.
+# TTLCache expires by insertion time, so get_rate_limiter re-inserts the bucket on
+# every access to make that an idle timeout: an active user keeps one bucket.
+_user_buckets: "TTLCache[Tuple[str, str], AsyncTokenBucket]" = TTLCache(maxsize=4096, ttl=3600)
+
+
+def get_rate_limit_per_minute(service_name: str) -> float:
+    """Get the configured per-user rate for a service (0 means unlimited)."""
+    env_value = os.getenv(f"WORKSPACE_MCP_{service_name.upper()}_RATE_LIMIT_PER_MINUTE")
+    if env_value:
+        try:
+            return float(env_value)
+        except ValueError:
+            logger.warning(
+                f"Ignoring invalid WORKSPACE_MCP_{service_name.upper()}_RATE_LIMIT_PER_MINUTE={env_value!r}"
+            )
+    return 0
+
+
+def get_rate_limiter(service_name: str, user_email: str):
+    """
+    Get the token bucket for a (service, user) pair.
+
+    Args:
+        service_name: Google service type (e.g. 'forms')
+        user_email: The user the request is made on behalf of
+
+    Returns:
+        An async context manager / acquirer; a no-op when the service is unlimited
+    """
+    rate = get_rate_limit_per_minute(service_name)
+    if rate <= 0:
+        return _NO_LIMIT
+    key = (service_name, user_email)
+    bucket = _user_buckets.get(key)
+    if bucket is None:
+        bucket = AsyncTokenBucket(rate)
+    _user_buckets[key] = bucket  # (re)starts the idle timer
+    return bucket
@@ -1,7 +1,12 @@
+import asyncio
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from typing import Optional, Union
 from importlib import metadata
 
+import anyio
 from fastapi.responses import HTMLResponse, JSONResponse
 from starlette.applications import Starlette
 from starlette.requests import Request
@@ -16,6 +21,7 @@ from auth.oauth_responses import create_error_response, create_success_response,
 from auth.auth_info_middleware import AuthInfoMiddleware
 from auth.fastmcp_google_auth import GoogleWorkspaceAuthProvider
 from auth.scopes import SCOPES
+from core.http_client import close_http_session
 from core.config import (
     USER_GOOGLE_EMAIL,
     get_transport_mode,
@@ -52,9 +58,48 @@ class SecureFastMCP(FastMCP):
         logger.info("Added middleware stack: Session Management")
         return app
 
+    async def run_async(self, *args, **kwargs) -> None:
+        """Run the server, closing the shared Google API HTTP session once it stops."""
+        try:
+            await super().run_async(*args, **kwargs)
+        finally:
+            # Shielded so the close still completes when shutdown came from a cancellation
+            with anyio.CancelScope(shield=True):
+                await close_http_session()
+
+# Blocking Google client calls run via asyncio.to_thread; the default executor
+# (min(32, cpu_count + 4) threads) is too small for concurrent I/O-bound tool calls.
+DEFAULT_THREAD_POOL_SIZE = 64
+_thread_pool: Optional[ThreadPoolExecutor] = None
+
+
+def get_thread_pool() -> ThreadPoolExecutor:
+    """Get the process-wide executor for blocking API calls, sized by WORKSPACE_MCP_THREAD_POOL_SIZE."""
+    global _thread_pool
+    if _thread_pool is None:
+        size = DEFAULT_THREAD_POOL_SIZE
+        env_value = os.getenv("WORKSPACE_MCP_THREAD_POOL_SIZE")
+        if env_value:
+            try:
+                size = max(1, int(env_value))
+            except ValueError:
+                logger.warning(f"Ignoring invalid WORKSPACE_MCP_THREAD_POOL_SIZE={env_value!r}")
+        _thread_pool = ThreadPoolExecutor(max_workers=size, thread_name_prefix="gapi")
+        logger.info(f"Using a {size}-thread pool for blocking Google API calls")
+    return _thread_pool
+
+
+@asynccontextmanager
+async def _server_lifespan(app):
+    """Install the shared thread pool as the running loop's default executor."""
+    asyncio.get_running_loop().set_default_executor(get_thread_pool())
+    yield {}
+
+
 server = SecureFastMCP(
     name="google_workspace",
     auth=None,
+    lifespan=_server_lifespan,
 )
 
 # Add the AuthInfo middleware to inject authentication into FastMCP context
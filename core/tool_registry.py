@@ -7,28 +7,36 @@ based on tier configuration, replacing direct @server.tool() decorators.
 
 import logging
 import functools
-import traceback
-from typing import Set, Optional, Callable
+import weakref
+from typing import AbstractSet, Set, Optional, Callable
 
 logger = logging.getLogger(__name__)
 
+# Prefixes of error messages that are already user-friendly and returned as-is
+_FORMATTED_ERROR_PREFIXES = ("**", "Error:", "API error", "❌")
+
+# Wrappers created by global_exception_handler. Tracked by identity rather than a
+# function attribute, since functools.wraps would copy an attribute onto outer wrappers.
+_exception_wrapped: "weakref.WeakSet[Callable]" = weakref.WeakSet()
+
 # Global registry of enabled tools
-_enabled_tools: Optional[Set[str]] = None
+_enabled_tools: Optional[AbstractSet[str]] = None
 
 def set_enabled_tools(tool_names: Optional[Set[str]]):
     """Set the globally enabled tools."""
     global _enabled_tools
-    _enabled_tools = tool_names
+    _enabled_tools = frozenset(tool_names) if tool_names is not None else None
+    is_tool_enabled.cache_clear()
 
-def get_enabled_tools() -> Optional[Set[str]]:
+def get_enabled_tools() -> Optional[AbstractSet[str]]:
     """Get the set of enabled tools, or None if all tools are enabled."""
     return _enabled_tools
 
+@functools.lru_cache(maxsize=1024)
 def is_tool_enabled(tool_name: str) -> bool:
-    """Check if a specific tool is enabled."""
-    if _enabled_tools is None:
-        return True  # All tools enabled by default
-    return tool_name in _enabled_tools
+    """Check if a specific tool is enabled. Cached per name; reset by set_enabled_tools()."""
+    enabled = _enabled_tools
+    return enabled is None or tool_name in enabled  # All tools enabled by default
 
 def conditional_tool(server, tool_name: str):
     """
@@ -59,36 +67,33 @@ def global_exception_handler(func: Callable) -> Callable:
     This is a safety net - most exceptions should be caught by the tool's own error handling
     (@handle_http_errors, etc.). This catches anything that escapes.
     """
+    tool_name = func.__name__
+
     @functools.wraps(func)
     async def wrapper(*args, **kwargs):
-        tool_name = func.__name__
+        # The success path is deliberately log-free: this wrapper runs on every
+        # tool call, so anything here is paid per request.
         try:
-            logger.debug(f"[GLOBAL EXCEPTION HANDLER] Executing tool: {tool_name}")
-            result = await func(*args, **kwargs)
-            logger.debug(f"[GLOBAL EXCEPTION HANDLER] Tool {tool_name} completed successfully")
-            return result
+            return await func(*args, **kwargs)
         except KeyboardInterrupt:
             # Don't catch keyboard interrupts - allow graceful shutdown
-            logger.info(f"[GLOBAL EXCEPTION HANDLER] KeyboardInterrupt in {tool_name}, re-raising")
+            logger.info("[GLOBAL EXCEPTION HANDLER] KeyboardInterrupt in %s, re-raising", tool_name)
             raise
         except Exception as e:
-            # Log the full exception with traceback
+            # Log the full exception; exc_info=True lets the formatter render the traceback
             error_str = str(e)
             error_type = type(e).__name__
             
             logger.error(
-                f"[GLOBAL EXCEPTION HANDLER] *** CAUGHT EXCEPTION *** Tool: {tool_name}, Type: {error_type}, Message: {error_str}",
+                "[GLOBAL EXCEPTION HANDLER] *** CAUGHT EXCEPTION *** Tool: %s, Type: %s, Message: %s",
+                tool_name, error_type, error_str,
                 exc_info=True
             )
             
-            # Log full traceback for troubleshooting
-            tb_str = traceback.format_exc()
-            logger.error(f"[GLOBAL EXCEPTION HANDLER] Full traceback for {tool_name}:\n{tb_str}")
-            
             # If the error message already looks user-friendly (starts with ** or has specific prefixes),
             # just return it as-is
-            if error_str.startswith("**") or error_str.startswith("Error:") or error_str.startswith("API error") or error_str.startswith("❌"):
-                logger.info(f"[GLOBAL EXCEPTION HANDLER] Returning formatted error from {tool_name}")
+            if error_str.startswith(_FORMATTED_ERROR_PREFIXES):
+                logger.info("[GLOBAL EXCEPTION HANDLER] Returning formatted error from %s", tool_name)
                 return error_str
             
             # Otherwise, create a formatted error message
@@ -100,9 +105,10 @@ def global_exception_handler(func: Callable) -> Callable:
                 f"If this persists, please check the server logs at mcp_server_debug.log for more details."
             )
             
-            logger.info(f"[GLOBAL EXCEPTION HANDLER] Returning error message to client for {tool_name}")
+            logger.info("[GLOBAL EXCEPTION HANDLER] Returning error message to client for %s", tool_name)
             return error_msg
     
+    _exception_wrapped.add(wrapper)
     return wrapper
 
 
@@ -126,8 +132,13 @@ def wrap_server_tool_method(server):
             logger.debug(f"Registering tool with exception handler: {tool_name}")
             
             # Wrap the function with global exception handler FIRST
-            # This ensures that when the tool is called, the exception handler is the outermost layer
-            safe_func = global_exception_handler(func)
+            # This ensures that when the tool is called, the exception handler is the outermost layer.
+            # Functions that are already the handler's wrapper (re-entry via conditional_tool)
+            # are never wrapped twice.
+            if func in _exception_wrapped:
+                safe_func = func
+            else:
+                safe_func = global_exception_handler(func)
             
             # Then register the safe version with FastMCP
             # The function `func` already has all other decorators applied to it
@@ -144,22 +155,17 @@ def filter_server_tools(server):
     if enabled_tools is None:
         return
     
-    tools_removed = 0
-    
     # Access FastMCP's tool registry via _tool_manager._tools
-    if hasattr(server, '_tool_manager'):
-        tool_manager = server._tool_manager
-        if hasattr(tool_manager, '_tools'):
-            tool_registry = tool_manager._tools
-            
-            tools_to_remove = []
-            for tool_name in list(tool_registry.keys()):
-                if not is_tool_enabled(tool_name):
-                    tools_to_remove.append(tool_name)
-            
-            for tool_name in tools_to_remove:
-                del tool_registry[tool_name]
-                tools_removed += 1
+    try:
+        tool_registry = server._tool_manager._tools
+    except AttributeError:
+        return
+    
+    # dict_keys supports set operations, so this is a single C-level difference
+    tools_to_remove = tool_registry.keys() - enabled_tools
+    for tool_name in tools_to_remove:
+        del tool_registry[tool_name]
+    tools_removed = len(tools_to_remove)
     
     if tools_removed > 0:
         logger.info(f"🔧 Tool tier filtering: removed {tools_removed} tools, {len(enabled_tools)} enabled")
\ No newline at end of file
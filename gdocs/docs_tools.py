@@ -15,6 +15,12 @@ from auth.service_decorator import require_google_service, require_multiple_serv
 from core.utils import extract_office_xml_text, handle_http_errors
 from core.server import server
 from core.comments import create_comment_tools
+from gdrive.drive_helpers import (
+    find_folder_by_name_pattern,
+    find_or_create_folder_path,
+    move_file_to_folder,
+    move_file_to_folder_path,
+)
 
 # Import helper functions for document operations
 from gdocs.docs_helpers import (
@@ -356,25 +362,28 @@ async def create_doc(
     # Handle folder placement
     folder_info = ""
     target_folder_id = folder_id
+    folder_moved = False
     
     # Priority 1: folder_path (navigate through nested folders)
     if folder_path and not folder_id:
-        from gdrive.drive_helpers import find_or_create_folder_path
-        folder_result = await find_or_create_folder_path(
+        folder_result = await move_file_to_folder_path(
             drive_service,
+            doc_id,
             folder_path,
             root_folder_id=search_within_folder_id,
-            create_missing=create_folders_if_missing
+            create_missing=create_folders_if_missing,
+            user_email=user_google_email,
+            file_name=title
         )
         if folder_result:
             target_folder_id = folder_result['id']
+            folder_moved = True
             folder_info = f" | Path: {folder_result['path_summary']}"
         else:
             folder_info = f" | Warning: Could not navigate folder path {' > '.join(folder_path)}, created in My Drive"
     
     # Priority 2: folder_name_contains (simple search)
     elif folder_name_contains and not folder_id:
-        from gdrive.drive_helpers import find_folder_by_name_pattern
         folder = await find_folder_by_name_pattern(
             drive_service,
             folder_name_contains,
@@ -390,8 +399,7 @@ async def create_doc(
             search_scope = f" within folder {search_within_folder_id}" if search_within_folder_id else " in all Drive"
             folder_info = f" | Warning: No folder found matching '{folder_name_contains}'{search_scope}, created in My Drive"
     
-    if target_folder_id:
-        from gdrive.drive_helpers import move_file_to_folder
+    if target_folder_id and not folder_moved:
         move_success = await move_file_to_folder(
             drive_service,
             doc_id,
@@ -405,16 +413,16 @@ async def create_doc(
     html_info = ""
     if save_raw_html and content and content_type == 'html':
         try:
-            from gdrive.drive_helpers import find_or_create_folder_path as _find_or_create
             from googleapiclient.http import MediaIoBaseUpload
 
             html_parent_id = target_folder_id or 'root'
 
-            html_folder_result = await _find_or_create(
+            html_folder_result = await find_or_create_folder_path(
                 drive_service,
                 [raw_html_subfolder],
                 root_folder_id=html_parent_id,
-                create_missing=True
+                create_missing=True,
+                user_email=user_google_email
             )
             html_folder_id = html_folder_result['id'] if html_folder_result else html_parent_id
 
@@ -5,8 +5,23 @@ Shared utilities for Google Drive operations including permission checking.
 """
 import re
 import asyncio
-from typing import List, Dict, Any, Optional
+import logging
+from typing import List, Dict, Any, Optional, Sequence, Tuple
 
+from cachetools import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Resolved folder paths, keyed by (user_email, root_folder_id, path tuple).
+# Folder IDs are stable, so repeat uploads into the same path skip the
+# per-level Drive lookups. Entries expire so trashed/renamed folders recover;
+# move_file_to_folder_path drops an entry as soon as a move into it fails.
+_FOLDER_PATH_CACHE: "TTLCache[Tuple[str, str, Tuple[str, ...]], Dict[str, Any]]" = TTLCache(
+    maxsize=512, ttl=600
+)
+
+# Permission roles that make an 'anyone' grant count as public link sharing
+_PUBLIC_ROLES = frozenset(('reader', 'writer', 'commenter'))
 
 def check_public_link_permission(permissions: List[Dict[str, Any]]) -> bool:
     """
@@ -18,10 +33,10 @@ def check_public_link_permission(permissions: List[Dict[str, Any]]) -> bool:
     Returns:
         bool: True if file has public link sharing enabled
     """
-    return any(
-        p.get('type') == 'anyone' and p.get('role') in ['reader', 'writer', 'commenter']
-        for p in permissions
-    )
+    for p in permissions:
+        if p.get('type') == 'anyone' and p.get('role') in _PUBLIC_ROLES:
+            return True
+    return False
 
 
 def format_public_sharing_error(file_name: str, file_id: str) -> str:
@@ -70,6 +85,60 @@ DRIVE_QUERY_PATTERNS = [
     re.compile(r'\bmimeType\s*(=|!=)\b', re.IGNORECASE),               # mimeType operators
 ]
 
+# All of the above as a single alternation, so detection is one scan of the input
+DRIVE_QUERY_COMBINED = re.compile(
+    "|".join(f"(?:{p.pattern})" for p in DRIVE_QUERY_PATTERNS), re.IGNORECASE
+)
+
+
+def is_drive_query(query: str) -> bool:
+    """
+    Check if a search string looks like a structured Drive query rather than free text.
+
+    Args:
+        query: The search string
+
+    Returns:
+        bool: True if any Drive query operator/pattern is present
+    """
+    return DRIVE_QUERY_COMBINED.search(query) is not None
+
+
+# Call-invariant parameters shared by every Drive list call; copied per call, never mutated
+_BASE_LIST_PARAMS: Dict[str, Any] = {
+    "fields": "nextPageToken, files(id, name, mimeType, webViewLink, iconLink, modifiedTime, size)",
+    "supportsAllDrives": True,
+    "orderBy": "modifiedTime desc",
+}
+
+
+def uncache_folder_path(
+    user_email: str,
+    folder_path: Optional[Sequence[str]] = None,
+    root_folder_id: Optional[str] = None,
+) -> int:
+    """
+    Drop cached find_or_create_folder_path results, e.g. after deleting or renaming a folder.
+
+    Args:
+        user_email: User whose cached paths should be dropped
+        folder_path: Path prefix to drop (the folder and everything below it). If None, drops all of the user's paths.
+        root_folder_id: Optional starting folder ID the path was resolved from. If None, matches any root.
+
+    Returns:
+        int: Number of cache entries removed
+    """
+    prefix = tuple(name.strip() for name in folder_path) if folder_path else ()
+    stale = [
+        key for key in list(_FOLDER_PATH_CACHE.keys())
+        if key[0] == user_email
+        and (root_folder_id is None or key[1] == root_folder_id)
+        and key[2][:len(prefix)] == prefix
+    ]
+    for key in stale:
+        _FOLDER_PATH_CACHE.pop(key, None)
+    return len(stale)
+
 
 def build_drive_list_params(
     query: str,
@@ -91,21 +160,14 @@ def build_drive_list_params(
     Returns:
         Dictionary of parameters for Drive API list calls
     """
-    list_params = {
-        "q": query,
-        "pageSize": page_size,
-        "fields": "nextPageToken, files(id, name, mimeType, webViewLink, iconLink, modifiedTime, size)",
-        "supportsAllDrives": True,
-        "includeItemsFromAllDrives": include_items_from_all_drives,
-        "orderBy": "modifiedTime desc",
-    }
+    list_params = _BASE_LIST_PARAMS.copy()
+    list_params["q"] = query
+    list_params["pageSize"] = page_size
+    list_params["includeItemsFromAllDrives"] = include_items_from_all_drives
 
     if drive_id:
         list_params["driveId"] = drive_id
-        if corpora:
-            list_params["corpora"] = corpora
-        else:
-            list_params["corpora"] = "drive"
+        list_params["corpora"] = corpora or "drive"
     elif corpora:
         list_params["corpora"] = corpora
 
@@ -133,25 +195,19 @@ async def find_folder_by_name_pattern(
     Returns:
         Dict with 'id', 'name', and 'webViewLink' of the folder, or None if not found
     """
-    import logging
-    logger = logging.getLogger(__name__)
-    
     # Escape single quotes in the pattern
     escaped_pattern = name_pattern.replace("'", "\\'")
     
-    # Build the base query for folder name matching
-    if exact_match:
-        query = f"mimeType='application/vnd.google-apps.folder' and name='{escaped_pattern}' and trashed=false"
-    else:
-        query = f"mimeType='application/vnd.google-apps.folder' and name contains '{escaped_pattern}' and trashed=false"
-    
-    # Add parent folder constraint if specified (this searches recursively)
+    # Build the query in one go: name match plus optional parent constraint (this searches recursively)
+    name_op = "=" if exact_match else " contains "
     if parent_folder_id:
         escaped_parent_id = parent_folder_id.replace("'", "\\'")
-        query += f" and '{escaped_parent_id}' in parents"
+        parent_clause = f" and '{escaped_parent_id}' in parents"
         logger.info(f"[find_folder_by_name_pattern] Searching for folder with pattern: '{name_pattern}' within parent folder: {parent_folder_id} (exact={exact_match})")
     else:
+        parent_clause = ""
         logger.info(f"[find_folder_by_name_pattern] Searching for folder with pattern: '{name_pattern}' across all Drive (exact={exact_match})")
+    query = f"mimeType='application/vnd.google-apps.folder' and name{name_op}'{escaped_pattern}' and trashed=false{parent_clause}"
     
     try:
         results = await asyncio.to_thread(
@@ -195,6 +251,8 @@ async def move_file_to_folder(
     file_id: str,
     folder_id: str,
     file_name: Optional[str] = None,
+    *,
+    known_previous_parents: Optional[Sequence[str]] = None,
 ) -> bool:
     """
     Move a file to a specific folder in Google Drive.
@@ -204,26 +262,27 @@ async def move_file_to_folder(
         file_id: ID of the file to move
         folder_id: ID of the destination folder
         file_name: Optional file name for logging
+        known_previous_parents: Current parent IDs, if the caller already has them
+            (e.g. from a files().copy/create response). Skips the parents lookup.
         
     Returns:
         bool: True if successful, False otherwise
     """
-    import logging
-    logger = logging.getLogger(__name__)
-    
     logger.info(f"[move_file_to_folder] Moving file {file_id} to folder {folder_id}")
     
     try:
-        # Get current parents
-        file = await asyncio.to_thread(
-            service.files().get(
-                fileId=file_id,
-                fields='parents',
-                supportsAllDrives=True
-            ).execute
-        )
+        if known_previous_parents is None:
+            # Get current parents
+            file = await asyncio.to_thread(
+                service.files().get(
+                    fileId=file_id,
+                    fields='parents',
+                    supportsAllDrives=True
+                ).execute
+            )
+            known_previous_parents = file.get('parents', [])
         
-        previous_parents = ",".join(file.get('parents', []))
+        previous_parents = ",".join(known_previous_parents)
         
         # Move the file to the new folder
         await asyncio.to_thread(
@@ -244,6 +303,64 @@ async def move_file_to_folder(
         return False
 
 
+async def move_file_to_folder_path(
+    service,
+    file_id: str,
+    folder_path: Sequence[str],
+    root_folder_id: Optional[str] = None,
+    create_missing: bool = True,
+    user_email: Optional[str] = None,
+    file_name: Optional[str] = None,
+    *,
+    resolved_folder: Optional[Dict[str, Any]] = None,
+    known_previous_parents: Optional[Sequence[str]] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    Move a file into a folder path, resolving (and creating) the path as needed.
+
+    Paths are resolved through find_or_create_folder_path and may come from its cache.
+    If the move fails, the cached folder may have been trashed, deleted or moved since,
+    so the path is dropped from the cache and resolved once more before retrying.
+
+    Args:
+        service: Google Drive service instance
+        file_id: ID of the file to move
+        folder_path: Folder names to navigate through (in order)
+        root_folder_id: Optional starting folder ID. If None, starts from My Drive root.
+        create_missing: If True, creates folders that don't exist
+        user_email: Optional user email, enabling the folder path cache
+        file_name: Optional file name for logging
+        resolved_folder: Result of an earlier find_or_create_folder_path call for this
+            path, if the caller already has one
+        known_previous_parents: Current parent IDs of the file, if known
+
+    Returns:
+        The final folder dict (as returned by find_or_create_folder_path), or None if the
+        path could not be resolved or the file could not be moved
+    """
+    folder = resolved_folder or await find_or_create_folder_path(
+        service, folder_path, root_folder_id, create_missing, user_email
+    )
+    if folder is None:
+        return None
+    if await move_file_to_folder(
+        service, file_id, folder['id'], file_name, known_previous_parents=known_previous_parents
+    ):
+        return folder
+
+    if not user_email or not uncache_folder_path(user_email, folder_path, root_folder_id or 'root'):
+        return None
+    logger.info(f"[move_file_to_folder_path] Move into cached folder {folder['id']} failed; resolving path again")
+    folder = await find_or_create_folder_path(
+        service, folder_path, root_folder_id, create_missing, user_email
+    )
+    if folder is not None and await move_file_to_folder(
+        service, file_id, folder['id'], file_name, known_previous_parents=known_previous_parents
+    ):
+        return folder
+    return None
+
+
 async def create_folder(
     service,
     folder_name: str,
@@ -260,9 +377,6 @@ async def create_folder(
     Returns:
         Dict with 'id', 'name', and 'webViewLink' of the created folder, or None if failed
     """
-    import logging
-    logger = logging.getLogger(__name__)
-    
     logger.info(f"[create_folder] Creating folder '{folder_name}' in parent {parent_folder_id or 'root'}")
     
     try:
@@ -295,11 +409,129 @@ async def create_folder(
         return None
 
 
+async def batch_drive_ops(service, requests: List[Any]) -> List[Any]:
+    """
+    Execute several Drive API requests as a single batch HTTP request.
+
+    All requests share one round trip instead of one thread-pool task and one
+    HTTP exchange each. Drive accepts at most 100 requests per batch.
+
+    Args:
+        service: Google Drive service instance
+        requests: Unexecuted request objects (e.g. service.files().get(...))
+
+    Returns:
+        List of responses, in the same order as `requests`
+
+    Raises:
+        The first per-request error (typically HttpError) if any request failed
+    """
+    results: List[Any] = [None] * len(requests)
+    errors: List[Exception] = []
+
+    def _callback(request_id, response, exception):
+        if exception is not None:
+            errors.append(exception)
+        else:
+            results[int(request_id)] = response
+
+    batch = service.new_batch_http_request(callback=_callback)
+    for i, request in enumerate(requests):
+        batch.add(request, request_id=str(i))
+    await asyncio.to_thread(batch.execute)
+
+    if errors:
+        raise errors[0]
+    return results
+
+
+async def _resolve_existing_folder_prefix(
+    service,
+    folder_path: Sequence[str],
+    root_folder_id: str,
+) -> List[Dict[str, str]]:
+    """
+    Resolve as much of an existing folder path as possible with a single Drive query.
+
+    Fetches the folders whose names appear in the path in one files().list call and
+    walks the parent links client-side (most recently modified wins, matching
+    find_folder_by_name_pattern). The first level is constrained to root_folder_id;
+    deeper parents are not known up front. Only the first result page is read: levels
+    it does not cover are finished by the per-level search, so common folder names
+    cost at most one extra request over that search. When starting from 'root', the
+    real root ID is fetched in the same batch HTTP request since the 'parents' field
+    never contains the 'root' alias.
+
+    Args:
+        service: Google Drive service instance
+        folder_path: Sanitized list of folder names
+        root_folder_id: Starting folder ID, or 'root' for My Drive root
+
+    Returns:
+        List of folder dicts ('id', 'name', 'webViewLink') for the matched leading
+        portion of the path. Empty if nothing matched or the lookup failed.
+    """
+    def _name_clause(name: str) -> str:
+        return "name='{}'".format(name.replace("'", "\\'"))
+
+    # Names used below the first level can sit under any folder; the first level only
+    # under root_folder_id (unless the same name also appears deeper in the path)
+    deeper_names = dict.fromkeys(folder_path[1:])
+    name_clauses = [_name_clause(name) for name in deeper_names]
+    if folder_path[0] not in deeper_names:
+        escaped_root = root_folder_id.replace("'", "\\'")
+        name_clauses.insert(0, f"({_name_clause(folder_path[0])} and '{escaped_root}' in parents)")
+    query = (
+        "mimeType='application/vnd.google-apps.folder' and trashed=false and "
+        f"({' or '.join(name_clauses)})"
+    )
+
+    list_request = service.files().list(
+        q=query,
+        pageSize=1000,
+        fields="files(id, name, webViewLink, parents)",
+        orderBy="modifiedTime desc",
+        supportsAllDrives=True,
+        includeItemsFromAllDrives=True,
+    )
+    try:
+        if root_folder_id == 'root':
+            root, results = await batch_drive_ops(
+                service, [service.files().get(fileId='root', fields='id'), list_request]
+            )
+            parent_id = root['id']
+        else:
+            results = await asyncio.to_thread(list_request.execute)
+            parent_id = root_folder_id
+        files = results.get('files', [])
+    except Exception as e:
+        logger.warning(f"[find_or_create_folder_path] Batched path lookup failed, falling back to per-level search: {e}")
+        return []
+
+    # First (most recent) folder per (parent, name), the page being in modifiedTime order.
+    # Levels not found here (e.g. beyond the first page) fall back to the per-level
+    # search in find_or_create_folder_path.
+    by_parent_and_name: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    for f in files:
+        for parent in f.get('parents', ()):
+            by_parent_and_name.setdefault((parent, f['name']), f)
+
+    matched = []
+    for name in folder_path:
+        f = by_parent_and_name.get((parent_id, name))
+        if f is None:
+            break
+        matched.append({'id': f['id'], 'name': f['name'], 'webViewLink': f.get('webViewLink', '')})
+        parent_id = f['id']
+    return matched
+
+
 async def find_or_create_folder_path(
     service,
-    folder_path: List[str],
+    folder_path: Sequence[str],
     root_folder_id: Optional[str] = None,
     create_missing: bool = True,
+    user_email: Optional[str] = None,
 ) -> Optional[Dict[str, Any]]:
     """
     Navigate through a folder path (e.g., ["CLIENTS", "xxx.fr", "SEO"]) by searching for each folder.
@@ -307,40 +539,57 @@ async def find_or_create_folder_path(
     
     Args:
         service: Google Drive service instance
-        folder_path: List of folder names to navigate through (in order). Uses exact name matching.
+        folder_path: Folder names (list or tuple) to navigate through (in order). Uses exact name matching.
         root_folder_id: Optional starting folder ID. If None, starts from My Drive root.
         create_missing: If True, creates folders that don't exist. If False, returns None if path doesn't exist.
+        user_email: Optional user email. When provided, resolved paths are cached per user for a few minutes.
         
     Returns:
         Dict with 'id', 'name', 'webViewLink', and 'path_summary' of the final folder, or None if failed
     """
-    import logging
-    logger = logging.getLogger(__name__)
-    
     if not folder_path:
         logger.warning("[find_or_create_folder_path] Empty folder path provided")
         return None
     
-    # Replace empty/whitespace-only folder names with "Untitled" to avoid creating unnamed folders
-    sanitized_path = []
-    for i, name in enumerate(folder_path):
-        if not name or not name.strip():
-            logger.warning(
-                f"[find_or_create_folder_path] Empty folder name at position {i + 1}, defaulting to 'Untitled'"
-            )
-            sanitized_path.append("Untitled")
-        else:
-            sanitized_path.append(name.strip())
-    folder_path = sanitized_path
-    
-    logger.info(f"[find_or_create_folder_path] Navigating path: {' > '.join(folder_path)} (create_missing={create_missing})")
+    # Replace empty/whitespace-only folder names with "Untitled" to avoid creating unnamed folders.
+    # Clean paths (the common case) are used as-is without building a new list.
+    if not all(name and name == name.strip() for name in folder_path):
+        sanitized_path = []
+        for i, name in enumerate(folder_path):
+            if not name or not name.strip():
+                logger.warning(
+                    f"[find_or_create_folder_path] Empty folder name at position {i + 1}, defaulting to 'Untitled'"
+                )
+                sanitized_path.append("Untitled")
+            else:
+                sanitized_path.append(name.strip())
+        folder_path = sanitized_path
     
     # Use 'root' as the starting parent if no root_folder_id is provided
     # This ensures the first folder is searched in My Drive root, not anywhere in Drive
     current_parent_id = root_folder_id if root_folder_id else 'root'
+
+    cache_key = (user_email, current_parent_id, tuple(folder_path)) if user_email else None
+    if cache_key is not None:
+        cached = _FOLDER_PATH_CACHE.get(cache_key)
+        if cached is not None:
+            logger.info(f"[find_or_create_folder_path] Cache hit for path: {cached['path_summary']}")
+            return dict(cached)
+    
+    logger.info(f"[find_or_create_folder_path] Navigating path: {' > '.join(folder_path)} (create_missing={create_missing})")
     path_summary = []
+    folder = None
+
+    # Resolve the existing part of the path in one round trip when there is more
+    # than one level; only the unmatched remainder is walked level by level.
+    if len(folder_path) > 1:
+        for folder in await _resolve_existing_folder_prefix(service, folder_path, current_parent_id):
+            path_summary.append(folder['name'])
+            current_parent_id = folder['id']
+        if path_summary:
+            logger.info(f"[find_or_create_folder_path] Resolved {len(path_summary)}/{len(folder_path)} levels in one lookup")
     
-    for i, folder_name in enumerate(folder_path):
+    for folder_name in folder_path[len(path_summary):]:
         # Try to find existing folder with exact name match
         folder = await find_folder_by_name_pattern(
             service,
@@ -382,5 +631,12 @@ async def find_or_create_folder_path(
         'path_summary': ' > '.join(path_summary)
     }
     
+    if cache_key is not None:
+        # Cache without the "(created)" markers: on a later hit nothing is created
+        _FOLDER_PATH_CACHE[cache_key] = {
+            **final_folder_info,
+            'path_summary': ' > '.join(folder_path),
+        }
+    
     logger.info(f"[find_or_create_folder_path] Successfully navigated to: {final_folder_info['path_summary']}")
     return final_folder_info
\ No newline at end of file
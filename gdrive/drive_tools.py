@@ -16,7 +16,7 @@ import httpx
 from auth.service_decorator import require_google_service
 from core.utils import extract_office_xml_text, handle_http_errors
 from core.server import server
-from gdrive.drive_helpers import DRIVE_QUERY_PATTERNS, build_drive_list_params
+from gdrive.drive_helpers import build_drive_list_params, is_drive_query
 
 logger = logging.getLogger(__name__)
 
@@ -52,7 +52,7 @@ async def search_drive_files(
 
     # Check if the query looks like a structured Drive query or free text
     # Look for Drive API operators and structured query patterns
-    is_structured_query = any(pattern.search(query) for pattern in DRIVE_QUERY_PATTERNS)
+    is_structured_query = is_drive_query(query)
 
     if is_structured_query:
         final_query = query
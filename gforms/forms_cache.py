@@ -0,0 +1,130 @@
+"""
+Persistent Form Metadata Cache
+
+Optional SQLite-backed store for forms.get results so a restarted server does not
+cold-start its form cache. Entries are revalidated with If-None-Match on first use,
+so a warm restart turns full form downloads into bodiless 304s.
+
+Disabled unless WORKSPACE_MCP_FORMS_CACHE_DB points at a database file. Uses the
+stdlib sqlite3 module, with all blocking calls run via asyncio.to_thread.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Maximum rows kept; the least recently refreshed entries are evicted beyond this
+MAX_ROWS = 2000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS form_cache (
+    user_email TEXT NOT NULL,
+    form_id TEXT NOT NULL,
+    blob TEXT NOT NULL,
+    etag TEXT,
+    last_refreshed REAL NOT NULL,
+    PRIMARY KEY (user_email, form_id)
+)
+"""
+
+
+class FormsDiskCache:
+    """SQLite table of (user_email, form_id) -> (form JSON, etag, last_refreshed wall time)."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(_SCHEMA)
+
+    def _load(self, user_email: str, form_id: str) -> Optional[Tuple[Dict[str, Any], Optional[str], float]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT blob, etag, last_refreshed FROM form_cache WHERE user_email = ? AND form_id = ?",
+                (user_email, form_id),
+            ).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0]), row[1], row[2]
+
+    def _store(self, user_email: str, form_id: str, form: Dict[str, Any], etag: Optional[str]) -> None:
+        blob = json.dumps(form)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO form_cache (user_email, form_id, blob, etag, last_refreshed) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (user_email, form_id, blob, etag, time.time()),
+            )
+            self._conn.execute(
+                "DELETE FROM form_cache WHERE rowid IN ("
+                "SELECT rowid FROM form_cache ORDER BY last_refreshed DESC LIMIT -1 OFFSET ?)",
+                (MAX_ROWS,),
+            )
+
+    def _delete(self, user_email: str, form_id: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM form_cache WHERE user_email = ? AND form_id = ?",
+                (user_email, form_id),
+            )
+
+    async def load(self, user_email: str, form_id: str) -> Optional[Tuple[Dict[str, Any], Optional[str], float]]:
+        """
+        Load a cached form.
+
+        Returns:
+            (form, etag, age_seconds) or None if not cached or the read failed
+        """
+        try:
+            entry = await asyncio.to_thread(self._load, user_email, form_id)
+        except (sqlite3.Error, ValueError) as e:
+            logger.warning("[forms_cache] Read failed for form %s: %s", form_id, e)
+            return None
+        if entry is None:
+            return None
+        form, etag, last_refreshed = entry
+        return form, etag, max(0.0, time.time() - last_refreshed)
+
+    async def store(self, user_email: str, form_id: str, form: Dict[str, Any], etag: Optional[str]) -> None:
+        """Store (or refresh) a form. Failures are logged and otherwise ignored."""
+        try:
+            await asyncio.to_thread(self._store, user_email, form_id, form, etag)
+        except sqlite3.Error as e:
+            logger.warning("[forms_cache] Write failed for form %s: %s", form_id, e)
+
+    async def delete(self, user_email: str, form_id: str) -> None:
+        """Drop a form. Failures are logged and otherwise ignored."""
+        try:
+            await asyncio.to_thread(self._delete, user_email, form_id)
+        except sqlite3.Error as e:
+            logger.warning("[forms_cache] Delete failed for form %s: %s", form_id, e)
+
+
+_disk_cache: Optional[FormsDiskCache] = None
+_disk_cache_initialized = False
+
+
+def get_forms_disk_cache() -> Optional[FormsDiskCache]:
+    """Get the process-wide disk cache, or None when WORKSPACE_MCP_FORMS_CACHE_DB is unset or unusable."""
+    global _disk_cache, _disk_cache_initialized
+    if not _disk_cache_initialized:
+        _disk_cache_initialized = True
+        path = os.getenv("WORKSPACE_MCP_FORMS_CACHE_DB")
+        if path:
+            try:
+                _disk_cache = FormsDiskCache(path)
+                logger.info("[forms_cache] Persistent form cache enabled at %s", path)
+            except (sqlite3.Error, OSError) as e:
+                logger.warning("[forms_cache] Could not open %s, persistent cache disabled: %s", path, e)
+    return _disk_cache
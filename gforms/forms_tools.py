@@ -4,17 +4,116 @@ Google Forms MCP Tools
 This module provides MCP tools for interacting with Google Forms API.
 """
 
+import io
 import logging
 import asyncio
-from typing import Optional, Dict, Any, List
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
+from cachetools import TTLCache
+from googleapiclient.errors import HttpError
 
 from auth.service_decorator import require_google_service, require_multiple_services
 from core.server import server
+from core.http_client import build_api_request, execute_async, quote_path_id
+from core.rate_limit import get_rate_limiter
 from core.utils import handle_http_errors
+from gdrive.drive_helpers import (
+    find_folder_by_name_pattern,
+    find_or_create_folder_path,
+    move_file_to_folder,
+    move_file_to_folder_path,
+)
+from gforms.forms_cache import get_forms_disk_cache
 
 logger = logging.getLogger(__name__)
 
+# Shared read-only default for .get() lookups on response dicts; never mutate
+_EMPTY_DICT: Dict[str, Any] = {}
+
+# Request paths for the hot read endpoints, relative to the service base URL
+_FORM_PATH = "v1/forms/{form_id}"
+_FORM_RESPONSES_PATH = "v1/forms/{form_id}/responses"
+
+# Largest pageSize accepted by forms.responses.list
+_MAX_RESPONSES_PAGE_SIZE = 5000
+
+# forms.get results keyed by (user_email, form_id) -> (form, etag). Every read revalidates
+# the entry with its ETag, so the cache saves payload, not requests, and is never stale.
+_FORM_CACHE: "TTLCache[Tuple[str, str], Tuple[Dict[str, Any], str]]" = TTLCache(
+    maxsize=256, ttl=3600
+)
+
+# In-flight reads keyed by request identity, shared by concurrent identical calls
+_INFLIGHT: Dict[Tuple, "asyncio.Future[Any]"] = {}
+
+
+async def _execute_forms(user_google_email: str, request) -> Any:
+    """Execute a Forms API request after taking a token from the user's Forms rate limiter."""
+    await get_rate_limiter("forms", user_google_email).acquire()
+    return await execute_async(request)
+
+
+async def _single_flight(key: Tuple, factory: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    Run factory() once for concurrent callers sharing the same key.
+
+    The first caller starts the work as a task; callers arriving while it is in flight
+    await the same task instead of issuing their own request. The task is shielded so
+    one caller being cancelled does not cancel it for the others.
+    """
+    task = _INFLIGHT.get(key)
+    if task is None:
+        task = asyncio.ensure_future(factory())
+        _INFLIGHT[key] = task
+        task.add_done_callback(lambda _t: _INFLIGHT.pop(key, None))
+    return await asyncio.shield(task)
+
+
+async def _get_form_cached(service, user_google_email: str, form_id: str) -> Dict[str, Any]:
+    """
+    Fetch a form, revalidating a per-user cached copy on every read.
+
+    Cached forms are requested with If-None-Match, so an unchanged form costs a
+    bodiless 304 instead of the full items payload while edits made elsewhere are
+    still seen immediately. Forms returned without an ETag are not cached.
+
+    When the persistent cache is enabled (WORKSPACE_MCP_FORMS_CACHE_DB), memory misses
+    fall back to it and every fetch or revalidation is written through.
+    """
+    cache_key = (user_google_email, form_id)
+    disk_cache = get_forms_disk_cache()
+
+    async def _fetch() -> Dict[str, Any]:
+        cached = _FORM_CACHE.get(cache_key)
+        if cached is None and disk_cache is not None:
+            stored = await disk_cache.load(user_google_email, form_id)
+            if stored is not None and stored[1]:
+                cached = (stored[0], stored[1])
+
+        request = build_api_request(service, _FORM_PATH.format(form_id=quote_path_id(form_id)))
+        response_headers: Dict[str, str] = {}
+        request.add_response_callback(response_headers.update)
+        if cached is not None:
+            request.headers["If-None-Match"] = cached[1]
+
+        try:
+            form = await _execute_forms(user_google_email, request)
+        except HttpError as e:
+            if cached is not None and e.resp.status == 304:
+                form, etag = cached[0], cached[1]
+            else:
+                raise
+        else:
+            etag = response_headers.get("etag")
+
+        if etag:
+            _FORM_CACHE[cache_key] = (form, etag)
+            if disk_cache is not None:
+                await disk_cache.store(user_google_email, form_id, form, etag)
+        return form
+
+    return await _single_flight(("get", *cache_key), _fetch)
+
 
 @server.tool()
 @handle_http_errors("create_form", service_type="forms")
@@ -52,7 +151,7 @@ async def create_form(
     Returns:
         str: Confirmation message with form ID and edit URL.
     """
-    logger.info(f"[create_form] Invoked. Email: '{user_google_email}', Title: {title}")
+    logger.info("[create_form] Invoked. Email: '%s', Title: %s", user_google_email, title)
 
     form_body: Dict[str, Any] = {
         "info": {
@@ -66,67 +165,101 @@ async def create_form(
     if document_title:
         form_body["info"]["document_title"] = document_title
 
-    created_form = await asyncio.to_thread(
-        forms_service.forms().create(body=form_body).execute
-    )
+    async def _find_target_folder() -> Optional[Dict[str, Any]]:
+        """Look up the destination folder without creating anything."""
+        if folder_path:
+            # Missing folders are only created once the form exists (see below)
+            return await find_or_create_folder_path(
+                drive_service,
+                folder_path,
+                root_folder_id=search_within_folder_id,
+                create_missing=False,
+                user_email=user_google_email
+            )
+        return await find_folder_by_name_pattern(
+            drive_service,
+            folder_name_contains,
+            exact_match=False,
+            user_email=user_google_email,
+            parent_folder_id=search_within_folder_id
+        )
+
+    create_request = _execute_forms(user_google_email, forms_service.forms().create(body=form_body))
+
+    # Handle folder placement. The folder lookup hits Drive, independent of the Forms
+    # create call, so both round trips are overlapped; only the move must wait for both.
+    folder = None
+    if (folder_path or folder_name_contains) and not folder_id:
+        created_form, folder = await asyncio.gather(create_request, _find_target_folder())
+    else:
+        created_form = await create_request
 
     form_id = created_form.get("formId")
     edit_url = f"https://docs.google.com/forms/d/{form_id}/edit"
     responder_url = created_form.get("responderUri", f"https://docs.google.com/forms/d/{form_id}/viewform")
-    
-    # Handle folder placement
+
     folder_info = ""
-    target_folder_id = folder_id
-    
-    # Priority 1: folder_path (navigate through nested folders)
-    if folder_path and not folder_id:
-        from gdrive.drive_helpers import find_or_create_folder_path
-        folder_result = await find_or_create_folder_path(
+    if folder_id:
+        if await move_file_to_folder(drive_service, form_id, folder_id):
+            folder_info = f" | Moved to folder: {folder_id}"
+    elif folder_path:
+        folder = await move_file_to_folder_path(
             drive_service,
+            form_id,
             folder_path,
             root_folder_id=search_within_folder_id,
-            create_missing=create_folders_if_missing
-        )
-        if folder_result:
-            target_folder_id = folder_result['id']
-            folder_info = f" | Path: {folder_result['path_summary']}"
-        else:
-            folder_info = f" | Warning: Could not navigate folder path {' > '.join(folder_path)}, created in My Drive"
-    
-    # Priority 2: folder_name_contains (simple search)
-    elif folder_name_contains and not folder_id:
-        from gdrive.drive_helpers import find_folder_by_name_pattern
-        folder = await find_folder_by_name_pattern(
-            drive_service,
-            folder_name_contains,
-            exact_match=False,
+            create_missing=create_folders_if_missing,
             user_email=user_google_email,
-            parent_folder_id=search_within_folder_id
+            resolved_folder=folder
         )
         if folder:
-            target_folder_id = folder['id']
+            folder_info = f" | Path: {folder['path_summary']}"
+        else:
+            folder_info = f" | Warning: Could not navigate folder path {' > '.join(folder_path)}, created in My Drive"
+    elif folder_name_contains:
+        if folder and await move_file_to_folder(drive_service, form_id, folder['id']):
             search_scope = f" within folder {search_within_folder_id}" if search_within_folder_id else ""
             folder_info = f" | Folder: '{folder['name']}' ({folder['id']}){search_scope}"
-        else:
+        elif not folder:
             search_scope = f" within folder {search_within_folder_id}" if search_within_folder_id else " in all Drive"
             folder_info = f" | Warning: No folder found matching '{folder_name_contains}'{search_scope}, created in My Drive"
-    
-    if target_folder_id:
-        from gdrive.drive_helpers import move_file_to_folder
-        move_success = await move_file_to_folder(
-            drive_service,
-            form_id,
-            target_folder_id,
-            file_name=title
-        )
-        if move_success and not folder_info:
-            folder_info = f" | Moved to folder: {target_folder_id}"
 
     confirmation_message = f"Successfully created form '{created_form.get('info', {}).get('title', title)}' for {user_google_email}. Form ID: {form_id}. Edit URL: {edit_url}. Responder URL: {responder_url}{folder_info}"
-    logger.info(f"Form created successfully for {user_google_email}. ID: {form_id}")
+    logger.info("Form created successfully for %s. ID: %s", user_google_email, form_id)
     return confirmation_message
 
 
+def _format_form(form: Dict[str, Any], form_id: str, user_google_email: str) -> str:
+    """Format a forms.get result as the get_form summary text."""
+    form_info = form.get("info", _EMPTY_DICT)
+    title = form_info.get("title", "No Title")
+    description = form_info.get("description", "No Description")
+    document_title = form_info.get("documentTitle", title)
+
+    edit_url = f"https://docs.google.com/forms/d/{form_id}/edit"
+    responder_url = form.get("responderUri", f"https://docs.google.com/forms/d/{form_id}/viewform")
+
+    items = form.get("items", [])
+
+    buf = io.StringIO()
+    buf.write(
+        f"Form Details for {user_google_email}:\n"
+        f"- Title: \"{title}\"\n"
+        f"- Description: \"{description}\"\n"
+        f"- Document Title: \"{document_title}\"\n"
+        f"- Form ID: {form_id}\n"
+        f"- Edit URL: {edit_url}\n"
+        f"- Responder URL: {responder_url}\n"
+        f"- Questions ({len(items)} total):"
+    )
+    for i, item in enumerate(items, 1):
+        required_text = " (Required)" if item.get("questionItem", _EMPTY_DICT).get("question", _EMPTY_DICT).get("required", False) else ""
+        buf.write(f"\n  {i}. {item.get('title', f'Question {i}')}{required_text}")
+    if not items:
+        buf.write("\n  No questions found")
+    return buf.getvalue()
+
+
 @server.tool()
 @handle_http_errors("get_form", is_read_only=True, service_type="forms")
 @require_google_service("forms", "forms")
@@ -145,42 +278,60 @@ async def get_form(
     Returns:
         str: Form details including title, description, questions, and URLs.
     """
-    logger.info(f"[get_form] Invoked. Email: '{user_google_email}', Form ID: {form_id}")
+    logger.info("[get_form] Invoked. Email: '%s', Form ID: %s", user_google_email, form_id)
 
-    form = await asyncio.to_thread(
-        service.forms().get(formId=form_id).execute
-    )
+    form = await _get_form_cached(service, user_google_email, form_id)
+    result = _format_form(form, form_id, user_google_email)
 
-    form_info = form.get("info", {})
-    title = form_info.get("title", "No Title")
-    description = form_info.get("description", "No Description")
-    document_title = form_info.get("documentTitle", title)
+    logger.info("Successfully retrieved form for %s. ID: %s", user_google_email, form_id)
+    return result
 
-    edit_url = f"https://docs.google.com/forms/d/{form_id}/edit"
-    responder_url = form.get("responderUri", f"https://docs.google.com/forms/d/{form_id}/viewform")
 
-    items = form.get("items", [])
-    questions_summary = []
-    for i, item in enumerate(items, 1):
-        item_title = item.get("title", f"Question {i}")
-        item_type = item.get("questionItem", {}).get("question", {}).get("required", False)
-        required_text = " (Required)" if item_type else ""
-        questions_summary.append(f"  {i}. {item_title}{required_text}")
-
-    questions_text = "\n".join(questions_summary) if questions_summary else "  No questions found"
-
-    result = f"""Form Details for {user_google_email}:
-- Title: "{title}"
-- Description: "{description}"
-- Document Title: "{document_title}"
-- Form ID: {form_id}
-- Edit URL: {edit_url}
-- Responder URL: {responder_url}
-- Questions ({len(items)} total):
-{questions_text}"""
-
-    logger.info(f"Successfully retrieved form for {user_google_email}. ID: {form_id}")
-    return result
+@server.tool()
+@handle_http_errors("get_forms_bulk", is_read_only=True, service_type="forms")
+@require_google_service("forms", "forms")
+async def get_forms_bulk(
+    service,
+    user_google_email: str,
+    form_ids: List[str],
+    max_concurrency: int = 10
+) -> str:
+    """
+    Get several forms at once, fetching them concurrently.
+
+    Args:
+        user_google_email (str): The user's Google email address. Required.
+        form_ids (List[str]): The IDs of the forms to retrieve.
+        max_concurrency (int): Maximum number of forms fetched at the same time. Defaults to 10.
+
+    Returns:
+        str: Form details for each form, in the order requested. Forms that could not be retrieved are reported inline.
+    """
+    logger.info("[get_forms_bulk] Invoked. Email: '%s', Form IDs: %s", user_google_email, form_ids)
+
+    if not form_ids:
+        return f"No form IDs provided for {user_google_email}."
+
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def _fetch(form_id: str) -> Dict[str, Any]:
+        async with semaphore:
+            return await _get_form_cached(service, user_google_email, form_id)
+
+    forms = await asyncio.gather(*(_fetch(form_id) for form_id in form_ids), return_exceptions=True)
+
+    sections = []
+    failed = 0
+    for form_id, form in zip(form_ids, forms):
+        # BaseException, not Exception: a fetch that was cancelled comes back as CancelledError
+        if isinstance(form, BaseException):
+            failed += 1
+            sections.append(f"Form {form_id}: Error retrieving form: {str(form) or type(form).__name__}")
+        else:
+            sections.append(_format_form(form, form_id, user_google_email))
+
+    logger.info("Successfully retrieved %s/%s forms for %s", len(form_ids) - failed, len(form_ids), user_google_email)
+    return "\n\n".join(sections)
 
 
 @server.tool()
@@ -205,19 +356,24 @@ async def set_publish_settings(
     Returns:
         str: Confirmation message of the successful publish settings update.
     """
-    logger.info(f"[set_publish_settings] Invoked. Email: '{user_google_email}', Form ID: {form_id}")
+    logger.info("[set_publish_settings] Invoked. Email: '%s', Form ID: %s", user_google_email, form_id)
 
     settings_body = {
         "publishAsTemplate": publish_as_template,
         "requireAuthentication": require_authentication
     }
 
-    await asyncio.to_thread(
-        service.forms().setPublishSettings(formId=form_id, body=settings_body).execute
+    await _execute_forms(
+        user_google_email,
+        service.forms().setPublishSettings(formId=form_id, body=settings_body)
     )
+    _FORM_CACHE.pop((user_google_email, form_id), None)
+    disk_cache = get_forms_disk_cache()
+    if disk_cache is not None:
+        await disk_cache.delete(user_google_email, form_id)
 
     confirmation_message = f"Successfully updated publish settings for form {form_id} for {user_google_email}. Publish as template: {publish_as_template}, Require authentication: {require_authentication}"
-    logger.info(f"Publish settings updated successfully for {user_google_email}. Form ID: {form_id}")
+    logger.info("Publish settings updated successfully for %s. Form ID: %s", user_google_email, form_id)
     return confirmation_message
 
 
@@ -241,37 +397,41 @@ async def get_form_response(
     Returns:
         str: Response details including answers and metadata.
     """
-    logger.info(f"[get_form_response] Invoked. Email: '{user_google_email}', Form ID: {form_id}, Response ID: {response_id}")
+    logger.info("[get_form_response] Invoked. Email: '%s', Form ID: %s, Response ID: %s", user_google_email, form_id, response_id)
 
-    response = await asyncio.to_thread(
-        service.forms().responses().get(formId=form_id, responseId=response_id).execute
+    response = await _execute_forms(
+        user_google_email,
+        service.forms().responses().get(formId=form_id, responseId=response_id)
     )
 
     response_id = response.get("responseId", "Unknown")
     create_time = response.get("createTime", "Unknown")
     last_submitted_time = response.get("lastSubmittedTime", "Unknown")
 
-    answers = response.get("answers", {})
-    answer_details = []
+    answers = response.get("answers", _EMPTY_DICT)
+
+    buf = io.StringIO()
+    buf.write(
+        f"Form Response Details for {user_google_email}:\n"
+        f"- Form ID: {form_id}\n"
+        f"- Response ID: {response_id}\n"
+        f"- Created: {create_time}\n"
+        f"- Last Submitted: {last_submitted_time}\n"
+        f"- Answers:"
+    )
+    write = buf.write
     for question_id, answer_data in answers.items():
-        question_response = answer_data.get("textAnswers", {}).get("answers", [])
+        text_answers = answer_data.get("textAnswers")
+        question_response = text_answers.get("answers") if text_answers else None
         if question_response:
-            answer_text = ", ".join([ans.get("value", "") for ans in question_response])
-            answer_details.append(f"  Question ID {question_id}: {answer_text}")
+            write(f"\n  Question ID {question_id}: {', '.join([ans.get('value', '') for ans in question_response])}")
         else:
-            answer_details.append(f"  Question ID {question_id}: No answer provided")
-
-    answers_text = "\n".join(answer_details) if answer_details else "  No answers found"
-
-    result = f"""Form Response Details for {user_google_email}:
-- Form ID: {form_id}
-- Response ID: {response_id}
-- Created: {create_time}
-- Last Submitted: {last_submitted_time}
-- Answers:
-{answers_text}"""
+            write(f"\n  Question ID {question_id}: No answer provided")
+    if not answers:
+        buf.write("\n  No answers found")
+    result = buf.getvalue()
 
-    logger.info(f"Successfully retrieved response for {user_google_email}. Response ID: {response_id}")
+    logger.info("Successfully retrieved response for %s. Response ID: %s", user_google_email, response_id)
     return result
 
 
@@ -283,7 +443,8 @@ async def list_form_responses(
     user_google_email: str,
     form_id: str,
     page_size: int = 10,
-    page_token: Optional[str] = None
+    page_token: Optional[str] = None,
+    fetch_all: bool = False
 ) -> str:
     """
     List a form's responses.
@@ -291,49 +452,53 @@ async def list_form_responses(
     Args:
         user_google_email (str): The user's Google email address. Required.
         form_id (str): The ID of the form.
-        page_size (int): Maximum number of responses to return. Defaults to 10.
+        page_size (int): Maximum number of responses to return. Defaults to 10. Ignored when fetch_all is True.
         page_token (Optional[str]): Token for retrieving next page of results.
+        fetch_all (bool): If True, fetch every remaining response using the largest page size the API allows. Defaults to False.
 
     Returns:
         str: List of responses with basic details and pagination info.
     """
-    logger.info(f"[list_form_responses] Invoked. Email: '{user_google_email}', Form ID: {form_id}")
+    logger.info("[list_form_responses] Invoked. Email: '%s', Form ID: %s", user_google_email, form_id)
 
-    params = {
-        "formId": form_id,
-        "pageSize": page_size
-    }
-    if page_token:
-        params["pageToken"] = page_token
+    responses_path = _FORM_RESPONSES_PATH.format(form_id=quote_path_id(form_id))
+    effective_page_size = _MAX_RESPONSES_PAGE_SIZE if fetch_all else page_size
 
-    responses_result = await asyncio.to_thread(
-        service.forms().responses().list(**params).execute
-    )
+    def _list_page(token: Optional[str]) -> Awaitable[Dict[str, Any]]:
+        params = {"pageSize": effective_page_size, "pageToken": token}
+        return _single_flight(
+            ("list", user_google_email, form_id, effective_page_size, token),
+            lambda: _execute_forms(user_google_email, build_api_request(service, responses_path, query=params))
+        )
 
-    responses = responses_result.get("responses", [])
+    responses_result = await _list_page(page_token)
+
+    responses = list(responses_result.get("responses", []))
     next_page_token = responses_result.get("nextPageToken")
 
+    # Auto-paginate at the API maximum so large forms take a handful of round trips
+    while fetch_all and next_page_token:
+        responses_result = await _list_page(next_page_token)
+        responses.extend(responses_result.get("responses", []))
+        next_page_token = responses_result.get("nextPageToken")
+
     if not responses:
         return f"No responses found for form {form_id} for {user_google_email}."
 
-    response_details = []
+    buf = io.StringIO()
+    buf.write(
+        f"Form Responses for {user_google_email}:\n"
+        f"- Form ID: {form_id}\n"
+        f"- Total responses returned: {len(responses)}\n"
+        f"- Responses:"
+    )
     for i, response in enumerate(responses, 1):
-        response_id = response.get("responseId", "Unknown")
-        create_time = response.get("createTime", "Unknown")
-        last_submitted_time = response.get("lastSubmittedTime", "Unknown")
-
-        answers_count = len(response.get("answers", {}))
-        response_details.append(
-            f"  {i}. Response ID: {response_id} | Created: {create_time} | Last Submitted: {last_submitted_time} | Answers: {answers_count}"
+        buf.write(
+            f"\n  {i}. Response ID: {response.get('responseId', 'Unknown')} | Created: {response.get('createTime', 'Unknown')} | "
+            f"Last Submitted: {response.get('lastSubmittedTime', 'Unknown')} | Answers: {len(response.get('answers', _EMPTY_DICT))}"
         )
+    buf.write(f"\nNext page token: {next_page_token}" if next_page_token else "\nNo more pages.")
+    result = buf.getvalue()
 
-    pagination_info = f"\nNext page token: {next_page_token}" if next_page_token else "\nNo more pages."
-
-    result = f"""Form Responses for {user_google_email}:
-- Form ID: {form_id}
-- Total responses returned: {len(responses)}
-- Responses:
-{chr(10).join(response_details)}{pagination_info}"""
-
-    logger.info(f"Successfully retrieved {len(responses)} responses for {user_google_email}. Form ID: {form_id}")
+    logger.info("Successfully retrieved %s responses for %s. Form ID: %s", len(responses), user_google_email, form_id)
     return result
\ No newline at end of file
@@ -4,18 +4,39 @@ Google Sheets MCP Tools
 This module provides MCP tools for interacting with Google Sheets API.
 """
 
-import logging
 import asyncio
+import functools
+import logging
 import json
+import random
 import re
-from typing import List, Optional, Union, Dict, Any
+from io import StringIO
+from itertools import repeat
+from operator import itemgetter
+from typing import AsyncIterator, Awaitable, List, Optional, Tuple, Union, Dict, Any
 
+from cachetools import TTLCache
 from googleapiclient.errors import HttpError
 
 from auth.service_decorator import require_google_service, require_multiple_services
 from core.server import server
+from core.http_client import build_api_request, execute_async, quote_path_id
+from core.rate_limit import get_rate_limiter
 from core.utils import handle_http_errors
 from core.comments import create_comment_tools
+from gdrive.drive_helpers import (
+    find_folder_by_name_pattern,
+    find_or_create_folder_path,
+    move_file_to_folder,
+    move_file_to_folder_path,
+    uncache_folder_path,
+)
+
+# orjson is optional; when installed it speeds up parsing of large values/rows payloads
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Configure module logger
 logger = logging.getLogger(__name__)
@@ -25,6 +46,49 @@ import os
 DISABLE_UTF8_FIX = os.getenv("DISABLE_UTF8_ENCODING_FIX", "false").lower() == "true"
 
 
+# Malformed 2-byte UTF-8 sequences written as bare hex: c2XX or c3XX (common French
+# accented chars: é, è, à, ç, etc.). Every possible pair is decoded once up front; pairs
+# that are not valid UTF-8 or decode to a non-printable char are left as-is.
+_UTF8_HEX_GUARD = re.compile(r'c[2-3][0-9a-f]{3}', re.IGNORECASE)
+_UTF8_HEX_PAIR = re.compile(r'c[2-3][0-9a-f]{2}', re.IGNORECASE)
+
+
+def _decode_utf8_hex_pair(lead: int, trail: int) -> Optional[str]:
+    try:
+        decoded = bytes((lead, trail)).decode("utf-8")
+    except UnicodeDecodeError:
+        return None
+    return decoded if decoded.isprintable() else None
+
+
+_UTF8_HEX_PAIRS: Dict[str, str] = {
+    f"c{lead & 0x0f}{trail:02x}": char
+    for lead in (0xc2, 0xc3)
+    for trail in range(256)
+    if (char := _decode_utf8_hex_pair(lead, trail)) is not None
+}
+
+
+def _replace_utf8_hex(match: "re.Match[str]") -> str:
+    hex_str = match.group(0)
+    return _UTF8_HEX_PAIRS.get(hex_str.lower(), hex_str)
+
+
+def _fix_utf8_hex(text: str) -> Optional[str]:
+    """Substitute malformed hex pairs in text, returning None when nothing changes."""
+    # Only process if it contains the specific malformed hex pattern
+    if not _UTF8_HEX_GUARD.search(text):
+        return None
+    result = _UTF8_HEX_PAIR.sub(_replace_utf8_hex, text)
+    return None if result == text else result
+
+
+# Short cell values repeat heavily across a sheet (categories, codes, names), so their
+# results are memoized. Long strings are rarely repeated and would bloat the cache.
+_UTF8_FIX_CACHE_MAX_LEN = 256
+_fix_short_utf8_hex = functools.lru_cache(maxsize=65536)(_fix_utf8_hex)
+
+
 def fix_utf8_encoding(text: str) -> str:
     """
     Fix incorrectly encoded UTF-8 characters that appear as lowercase hex bytes.
@@ -40,68 +104,93 @@ def fix_utf8_encoding(text: str) -> str:
     if '%' in text or '\ufffd' in text or '��' in text:
         return text
     
-    # Only process if it contains the specific malformed hex pattern
-    if not re.search(r'c[2-3][0-9a-f]{3}', text, re.IGNORECASE):
+    if len(text) <= _UTF8_FIX_CACHE_MAX_LEN:
+        result = _fix_short_utf8_hex(text)
+    else:
+        result = _fix_utf8_hex(text)
+    if result is None:
         return text
-    
+    logger.debug(f"[fix_utf8_encoding] Fixed encoding: '{text[:50]}...' → '{result[:50]}...'")
+    return result
+
+
+_UTF8_HEX_GUARD_BYTES = re.compile(rb'c[2-3][0-9a-f]{3}', re.IGNORECASE)
+
+
+def _may_need_utf8_fix(data: Any) -> bool:
+    """
+    Cheap pre-scan: serialize once and search for the malformed hex pattern.
+
+    JSON never escapes the characters the pattern matches, so a miss here proves no
+    string inside `data` would be changed by fix_encoding_recursive.
+    """
     try:
-        # Pattern: match ONLY 2-byte UTF-8 sequences that look malformed
-        # c2XX or c3XX (common French accented chars: é, è, à, ç, etc.)
-        pattern = r'c([2-3])([0-9a-f]{2})'
-        
-        def replace_hex(match):
-            hex_str = match.group(0)
-            # Verify this looks like a UTF-8 byte pair
-            byte1 = match.group(1)
-            byte2 = match.group(2)
-            
-            # Add % signs to make it proper URL encoding
-            hex_with_percent = f'%C{byte1}%{byte2.upper()}'
-            try:
-                # Decode the URL-encoded UTF-8
-                import urllib.parse
-                decoded = urllib.parse.unquote(hex_with_percent)
-                # Only return decoded if it's a single character and printable
-                if len(decoded) == 1 and decoded.isprintable():
-                    return decoded
-                return hex_str
-            except:
-                return hex_str
-        
-        result = re.sub(pattern, replace_hex, text, flags=re.IGNORECASE)
-        if result != text:
-            logger.debug(f"[fix_utf8_encoding] Fixed encoding: '{text[:50]}...' → '{result[:50]}...'")
-        return result
-    except Exception as e:
-        logger.warning(f"[fix_utf8_encoding] Error fixing encoding: {e}")
-        return text
+        payload = orjson.dumps(data) if orjson is not None else json.dumps(data).encode("utf-8")
+    except (TypeError, ValueError):
+        return True
+    return _UTF8_HEX_GUARD_BYTES.search(payload) is not None
+
+
+def _fix_encoding_string(text: str, log_samples: bool) -> str:
+    """Fix one string, optionally logging suspicious samples before and after."""
+    # Log suspicious patterns for debugging; the scan is skipped unless INFO is enabled
+    log_samples = log_samples and logger.isEnabledFor(logging.INFO)
+    if log_samples:
+        lowered = text.lower()
+        if ('c' in lowered and ('2' in lowered or '3' in lowered)) or '��' in text or '%' in text:
+            logger.info("[fix_encoding_recursive] Sample before: %.100s", text)
+
+    fixed = fix_utf8_encoding(text)
+
+    if log_samples and fixed is not text:
+        logger.info("[fix_encoding_recursive] Sample after: %.100s", fixed)
+
+    return fixed
 
 
 def fix_encoding_recursive(data: Any, log_samples: bool = False) -> Any:
     """
     Recursively fix UTF-8 encoding in all string values within nested structures.
+
+    Strings inside a container are fixed inline, so a list of rows costs one call per
+    row rather than per cell. Containers are copied only when one of their values
+    changes; otherwise the original object is returned as-is.
     
     Args:
         data: Data structure to fix
         log_samples: If True, log sample values for debugging
     """
     if isinstance(data, str):
-        # Log suspicious patterns for debugging
-        if log_samples and (('c' in data.lower() and any(c in data.lower() for c in ['2', '3'])) or '��' in data or '%' in data):
-            logger.info(f"[fix_encoding_recursive] Sample before: {data[:100]}")
-        
-        fixed = fix_utf8_encoding(data)
-        
-        if log_samples and fixed != data:
-            logger.info(f"[fix_encoding_recursive] Sample after: {fixed[:100]}")
-        
-        return fixed
-    elif isinstance(data, list):
-        return [fix_encoding_recursive(item, log_samples) for item in data]
-    elif isinstance(data, dict):
-        return {key: fix_encoding_recursive(value, log_samples) for key, value in data.items()}
-    else:
-        return data
+        return _fix_encoding_string(data, log_samples)
+    if isinstance(data, list):
+        fixed_list = None
+        for i, item in enumerate(data):
+            if isinstance(item, str):
+                fixed = _fix_encoding_string(item, log_samples)
+            elif isinstance(item, (list, dict)):
+                fixed = fix_encoding_recursive(item, log_samples)
+            else:
+                continue
+            if fixed is not item:
+                if fixed_list is None:
+                    fixed_list = list(data)
+                fixed_list[i] = fixed
+        return data if fixed_list is None else fixed_list
+    if isinstance(data, dict):
+        fixed_dict = None
+        for key, value in data.items():
+            if isinstance(value, str):
+                fixed = _fix_encoding_string(value, log_samples)
+            elif isinstance(value, (list, dict)):
+                fixed = fix_encoding_recursive(value, log_samples)
+            else:
+                continue
+            if fixed is not value:
+                if fixed_dict is None:
+                    fixed_dict = dict(data)
+                fixed_dict[key] = fixed
+        return data if fixed_dict is None else fixed_dict
+    return data
 
 
 def _remove_trailing_commas(json_str: str) -> str:
@@ -158,7 +247,13 @@ def _repair_json_string(json_str: str, context: str = "") -> Any:
     Raises:
         json.JSONDecodeError: If JSON cannot be repaired after all attempts.
     """
-    # 1. Try parsing as-is
+    # 1. Try parsing as-is (orjson first when available; stdlib supplies the
+    #    error position/message the repair steps below rely on)
+    if orjson is not None:
+        try:
+            return orjson.loads(json_str)
+        except orjson.JSONDecodeError:
+            pass
     try:
         return json.loads(json_str)
     except json.JSONDecodeError as first_error:
@@ -202,6 +297,22 @@ def _repair_json_string(json_str: str, context: str = "") -> Any:
     raise first_error
 
 
+# JSON arguments larger than this are parsed in a worker thread
+_JSON_PARSE_OFFLOAD_THRESHOLD = 64 * 1024
+
+
+async def _parse_json_argument(json_str: str, context: str = "") -> Any:
+    """
+    Parse a JSON tool argument via _repair_json_string.
+
+    Large payloads are parsed with asyncio.to_thread so a multi-megabyte
+    values/rows string does not stall other requests on the event loop.
+    """
+    if len(json_str) > _JSON_PARSE_OFFLOAD_THRESHOLD:
+        return await asyncio.to_thread(_repair_json_string, json_str, context)
+    return _repair_json_string(json_str, context)
+
+
 def _col_idx_to_letter(idx: int) -> str:
     """Convert a 0-based column index to A1-style column letters (0->A, 25->Z, 26->AA)."""
     if idx < 0:
@@ -216,6 +327,410 @@ def _col_idx_to_letter(idx: int) -> str:
     return letters
 
 
+# Exact types of plain JSON scalars; rows made only of these never need flattening.
+# Anything else (lists, dicts, subclasses) takes the per-cell isinstance path.
+_PRIMITIVE_CELL_TYPES = frozenset((str, int, float, bool, type(None)))
+
+
+def _flatten_cell_value(value: Any, row_idx: int, col_idx: int, log_prefix: str) -> Any:
+    """Convert nested lists/arrays to comma-separated strings, keep primitives as-is."""
+    if isinstance(value, (list, tuple)):
+        logger.warning(
+            "[%s] Found nested list at row %d, column %d. Converting to comma-separated string: %s",
+            log_prefix, row_idx, col_idx, value,
+        )
+        # Recursively flatten and join with commas
+        flattened = []
+        for item in value:
+            if isinstance(item, (list, tuple)):
+                flattened.extend(_flatten_cell_value(item, row_idx, col_idx, log_prefix))
+            else:
+                flattened.append(str(item) if item is not None else "")
+        return ", ".join(flattened)
+    elif isinstance(value, dict):
+        logger.warning(
+            "[%s] Found dict at row %d, column %d. Converting to JSON string: %s",
+            log_prefix, row_idx, col_idx, value,
+        )
+        return json.dumps(value)
+    else:
+        # Primitive value (string, number, boolean, None)
+        return value
+
+
+def _flatten_values(values: List[List[Any]], log_prefix: str) -> List[List[Any]]:
+    """
+    Flatten nested cells in a 2D values array; rows of plain JSON scalars are kept as-is.
+
+    Copy-on-write: when no row needs flattening (the common case), values itself is returned.
+    """
+    flattened_values = None
+    for i, row in enumerate(values):
+        if _PRIMITIVE_CELL_TYPES.issuperset(map(type, row)):
+            continue
+        if flattened_values is None:
+            flattened_values = list(values)
+        flattened_values[i] = [_flatten_cell_value(cell, i, j, log_prefix) for j, cell in enumerate(row)]
+    return values if flattened_values is None else flattened_values
+
+
+def _first_non_instance(items: List[Any], cls: type) -> Optional[int]:
+    """Index of the first element of items that is not an instance of cls, or None."""
+    # Check all elements in one C-level pass; locate the offender only on failure
+    if all(map(isinstance, items, repeat(cls))):
+        return None
+    return next(i for i, item in enumerate(items) if not isinstance(item, cls))
+
+
+# Upper bound on chunk writes in flight for one chunked values.update call
+_MAX_CONCURRENT_CHUNK_WRITES = 4
+
+# Serialized size budget per values write request, well under the API's body limit
+_VALUES_BATCH_MAX_BYTES = 8 * 1024 * 1024
+
+
+def _json_size(value: Any) -> int:
+    """Size in bytes of value serialized as JSON."""
+    if orjson is not None:
+        try:
+            return len(orjson.dumps(value))
+        except TypeError:
+            pass
+    return len(json.dumps(value))
+
+
+def _split_by_json_size(rows: List[List[Any]], max_bytes: int) -> List[List[List[Any]]]:
+    """
+    Split rows into consecutive slices whose JSON encoding fits in max_bytes.
+
+    Returns [rows] unchanged when the whole payload fits (the common case). Otherwise
+    slices are sized from the average row size and halved until they fit; a single
+    row is always sent on its own, whatever its size.
+    """
+    total_bytes = _json_size(rows)
+    if total_bytes <= max_bytes:
+        return [rows]
+    rows_per_slice = max(1, len(rows) * max_bytes // total_bytes)
+    slices = []
+    start = 0
+    while start < len(rows):
+        count = rows_per_slice
+        chunk = rows[start : start + count]
+        while count > 1 and _json_size(chunk) > max_bytes:
+            count //= 2
+            chunk = rows[start : start + count]
+        slices.append(chunk)
+        start += len(chunk)
+    return slices
+
+
+# A1 range with optional sheet prefix, e.g. "Sheet1!A1:Z100" or "A1:Z100"
+_A1_RANGE_RE = re.compile(r"(?:([^!]+)!)?([A-Z]+)(\d+)(?::([A-Z]+)(\d+))?")
+
+# Field masks for spreadsheets.get: sheet identity and grid size, optionally with row-1 cell text
+_SHEET_PROPERTIES_FIELDS = "sheets.properties(sheetId,title,gridProperties(rowCount,columnCount))"
+_SHEET_WITH_HEADER_FIELDS = (
+    "sheets(properties(sheetId,title,gridProperties(rowCount,columnCount)),"
+    "data(rowData(values(formattedValue))))"
+)
+
+# Per-request retry for Sheets calls. 429 means the request was rejected before it
+# was applied, so it is safe to retry for writes too; 5xx is only retried for reads,
+# since a write (e.g. values.append) may have landed before the server failed.
+_SHEETS_MAX_ATTEMPTS = 4
+_SHEETS_BASE_DELAY_S = 1.0
+_SHEETS_RATE_LIMIT_BASE_DELAY_S = 5.0
+# Upper bound on the total time one call spends sleeping between retries; a Retry-After
+# that would push past it is surfaced as the error instead of waited out
+_SHEETS_MAX_RETRY_WAIT_S = 60.0
+_SHEETS_READ_RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+_SHEETS_WRITE_RETRYABLE_STATUSES = {429}
+# Read-only methods that are sent as POST because they take a request body
+_SHEETS_READ_POST_SUFFIXES = (":getByDataFilter", ":batchGetByDataFilter")
+
+
+def _retry_after_seconds(error: HttpError) -> Optional[float]:
+    """Read a Retry-After header given in seconds from an HttpError, or None if absent/unparseable."""
+    value = getattr(error, "resp", None) and error.resp.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+async def _execute_sheets(user_google_email: str, request, idempotent: bool = False) -> Any:
+    """
+    Execute a Sheets API request, retrying transient errors.
+
+    Reads (GET, plus the POST-bodied *ByDataFilter lookups) draw from the 'sheets_read' limiter
+    and everything else from 'sheets_write', matching Google's separate per-user read and
+    write quotas; both are unlimited unless configured (see core.rate_limit). A 429 waits for
+    the server's Retry-After when given, and retries stop once the total wait would exceed
+    _SHEETS_MAX_RETRY_WAIT_S.
+
+    Args:
+        idempotent: Set for writes that are safe to replay (e.g. sort + deleteDuplicates),
+            so they are also retried on 5xx like reads
+    """
+    is_read = request.method == "GET" or request.uri.split("?", 1)[0].endswith(_SHEETS_READ_POST_SUFFIXES)
+    limiter = get_rate_limiter("sheets_read" if is_read else "sheets_write", user_google_email)
+    retryable = (
+        _SHEETS_READ_RETRYABLE_STATUSES if is_read or idempotent else _SHEETS_WRITE_RETRYABLE_STATUSES
+    )
+    waited = 0.0
+    for attempt in range(_SHEETS_MAX_ATTEMPTS):
+        await limiter.acquire()
+        try:
+            return await execute_async(request)
+        except HttpError as e:
+            status = getattr(e.resp, "status", None)
+            if status not in retryable or attempt >= _SHEETS_MAX_ATTEMPTS - 1:
+                raise
+            retry_after = _retry_after_seconds(e) if status == 429 else None
+            if retry_after is not None:
+                delay = retry_after
+            else:
+                base = _SHEETS_RATE_LIMIT_BASE_DELAY_S if status == 429 else _SHEETS_BASE_DELAY_S
+                delay = base * (2 ** attempt) * random.uniform(1.0, 1.5)
+            if waited + delay > _SHEETS_MAX_RETRY_WAIT_S:
+                raise
+            waited += delay
+            logger.warning(
+                f"[sheets] HTTP {status} on attempt {attempt + 1}/{_SHEETS_MAX_ATTEMPTS}. "
+                f"Retrying in {delay:.1f}s..."
+            )
+            await asyncio.sleep(delay)
+
+
+_BATCH_UPDATE_PATH = "v4/spreadsheets/{spreadsheet_id}:batchUpdate"
+
+
+def _batch_update_request(service, spreadsheet_id: str, requests: List[Dict[str, Any]]):
+    """Build a spreadsheets.batchUpdate request directly, skipping discovery method dispatch."""
+    return build_api_request(
+        service,
+        _BATCH_UPDATE_PATH.format(spreadsheet_id=quote_path_id(spreadsheet_id)),
+        method="POST",
+        body={"requests": requests},
+    )
+
+
+# Bulk values writes are built directly too, so their (possibly multi-megabyte) bodies are
+# serialized once by the HTTP layer's JSON model (orjson when installed)
+_VALUES_APPEND_PATH = "v4/spreadsheets/{spreadsheet_id}/values/{range}:append"
+_VALUES_BATCH_UPDATE_PATH = "v4/spreadsheets/{spreadsheet_id}/values:batchUpdate"
+
+
+def _values_append_request(
+    service,
+    spreadsheet_id: str,
+    range_name: str,
+    values: List[List[Any]],
+    value_input_option: str,
+    insert_data_option: str,
+):
+    """Build a spreadsheets.values.append request directly, skipping discovery method dispatch."""
+    return build_api_request(
+        service,
+        _VALUES_APPEND_PATH.format(
+            spreadsheet_id=quote_path_id(spreadsheet_id), range=quote_path_id(range_name)
+        ),
+        method="POST",
+        query={"valueInputOption": value_input_option, "insertDataOption": insert_data_option},
+        body={"values": values},
+    )
+
+
+def _values_batch_update_request(
+    service, spreadsheet_id: str, data: List[Dict[str, Any]], value_input_option: str
+):
+    """Build a spreadsheets.values.batchUpdate request directly, skipping discovery method dispatch."""
+    return build_api_request(
+        service,
+        _VALUES_BATCH_UPDATE_PATH.format(spreadsheet_id=quote_path_id(spreadsheet_id)),
+        method="POST",
+        body={"valueInputOption": value_input_option, "data": data},
+    )
+
+
+# Concurrent batchUpdates for the same spreadsheet are merged into one request (see
+# _coalesced_batch_update). Keys with a batchUpdate in flight; calls arriving for such a
+# key queue in _pending_batch_updates and go out together once it finishes.
+_inflight_batch_updates: set = set()
+_pending_batch_updates: Dict[Tuple[str, str, bool], List[Tuple[asyncio.Future, List[Dict[str, Any]]]]] = {}
+_batch_flush_tasks: set = set()
+
+
+async def _coalesced_batch_update(
+    service,
+    user_google_email: str,
+    spreadsheet_id: str,
+    requests: List[Dict[str, Any]],
+    idempotent: bool = False,
+) -> List[Dict[str, Any]]:
+    """
+    Submit batchUpdate sub-requests, merged with concurrent calls for the same spreadsheet.
+
+    A call with nothing else in flight for the spreadsheet is sent straight away; calls
+    that arrive while one is in flight are queued and sent as one merged batchUpdate
+    when it completes. Only calls with the same `idempotent` flag are merged (see
+    _execute_sheets).
+
+    Returns:
+        The replies for this caller's sub-requests only
+    """
+    key = (user_google_email, spreadsheet_id, idempotent)
+    if key not in _inflight_batch_updates:
+        _inflight_batch_updates.add(key)
+        try:
+            response = await _execute_sheets(
+                user_google_email,
+                _batch_update_request(service, spreadsheet_id, requests),
+                idempotent=idempotent,
+            )
+        finally:
+            _start_batch_flush(service, key)
+        return response.get("replies", [])
+
+    future = asyncio.get_running_loop().create_future()
+    _pending_batch_updates.setdefault(key, []).append((future, requests))
+    return await future
+
+
+def _start_batch_flush(service, key: Tuple[str, str, bool]) -> None:
+    """Hand the key to a flush task if calls queued while it was in flight, else release it."""
+    if not _pending_batch_updates.get(key):
+        _pending_batch_updates.pop(key, None)
+        _inflight_batch_updates.discard(key)
+        return
+    task = asyncio.get_running_loop().create_task(_flush_batch_updates(service, key))
+    _batch_flush_tasks.add(task)
+    task.add_done_callback(_batch_flush_tasks.discard)
+
+
+async def _flush_batch_updates(service, key: Tuple[str, str, bool]) -> None:
+    """Send queued sub-requests for one spreadsheet until none are left, then release the key."""
+    try:
+        while True:
+            queued = [(f, r) for f, r in _pending_batch_updates.pop(key, []) if not f.done()]
+            if not queued:
+                return
+            if len(queued) == 1:
+                await _send_batch_update(service, key, *queued[0])
+            else:
+                await _send_merged_batch_update(service, key, queued)
+    finally:
+        _inflight_batch_updates.discard(key)
+        for f, _ in _pending_batch_updates.pop(key, []):
+            f.cancel()
+
+
+async def _send_merged_batch_update(
+    service, key: Tuple[str, str, bool], queued: List[Tuple[asyncio.Future, List[Dict[str, Any]]]]
+) -> None:
+    """Send several callers' sub-requests as one batchUpdate and hand each caller its replies."""
+    user_google_email, spreadsheet_id, idempotent = key
+    try:
+        response = await _execute_sheets(
+            user_google_email,
+            _batch_update_request(service, spreadsheet_id, [req for _, reqs in queued for req in reqs]),
+            idempotent=idempotent,
+        )
+    except Exception as e:
+        status = getattr(getattr(e, "resp", None), "status", None) if isinstance(e, HttpError) else None
+        # A merged batch is atomic, so one caller's failure would fail all of them. A 4xx
+        # means nothing was applied, and idempotent batches are safe to replay anyway, so
+        # resend each caller's requests on their own to give each its own outcome. A 5xx
+        # on a non-idempotent batch may have landed, so it is not replayed.
+        if idempotent or (status is not None and 400 <= status < 500):
+            logger.info(
+                f"[sheets] Merged batchUpdate for {spreadsheet_id} failed; retrying {len(queued)} callers separately"
+            )
+            await asyncio.gather(*(_send_batch_update(service, key, f, r) for f, r in queued))
+            return
+        for f, _ in queued:
+            if not f.done():
+                f.set_exception(e)
+        return
+    except BaseException:
+        for f, _ in queued:
+            f.cancel()
+        raise
+    replies = response.get("replies", [])
+    offset = 0
+    for f, reqs in queued:
+        if not f.done():
+            f.set_result(replies[offset:offset + len(reqs)])
+        offset += len(reqs)
+
+
+async def _send_batch_update(
+    service, key: Tuple[str, str, bool], future: asyncio.Future, requests: List[Dict[str, Any]]
+) -> None:
+    """Send one caller's sub-requests unmerged, resolving its future with the outcome."""
+    user_google_email, spreadsheet_id, idempotent = key
+    try:
+        response = await _execute_sheets(
+            user_google_email,
+            _batch_update_request(service, spreadsheet_id, requests),
+            idempotent=idempotent,
+        )
+    except Exception as e:
+        if not future.done():
+            future.set_exception(e)
+        return
+    if not future.done():
+        future.set_result(response.get("replies", []))
+
+
+# Spreadsheet title + sheet properties keyed by (user_email, spreadsheet_id).
+# Short-lived; tools that change sheets or grid sizes drop the entry for that spreadsheet.
+# Changes made outside this process are not seen until the entry expires, so explicit
+# info reads and destructive operations fetch fresh metadata instead.
+_SPREADSHEET_METADATA_CACHE: "TTLCache[Tuple[str, str], Dict[str, Any]]" = TTLCache(maxsize=256, ttl=60)
+
+
+async def _get_spreadsheet_metadata(
+    service, user_google_email: str, spreadsheet_id: str, fresh: bool = False
+) -> Dict[str, Any]:
+    """
+    Get the spreadsheet title and sheet properties, served from a 60s cache when possible.
+
+    With fresh=True the cache is bypassed (and refreshed with the result).
+    """
+    cache_key = (user_google_email, spreadsheet_id)
+    metadata = None if fresh else _SPREADSHEET_METADATA_CACHE.get(cache_key)
+    if metadata is None:
+        metadata = await _execute_sheets(
+            user_google_email,
+            service.spreadsheets()
+            .get(spreadsheetId=spreadsheet_id, fields=f"properties.title,{_SHEET_PROPERTIES_FIELDS}")
+        )
+        _SPREADSHEET_METADATA_CACHE[cache_key] = metadata
+    return metadata
+
+
+def _invalidate_spreadsheet_metadata(user_google_email: str, spreadsheet_id: str) -> None:
+    """Drop cached metadata after a change to the spreadsheet's sheets or grid sizes."""
+    _SPREADSHEET_METADATA_CACHE.pop((user_google_email, spreadsheet_id), None)
+
+
+def _header_row_from_grid(sheet: Dict[str, Any]) -> List[str]:
+    """
+    Extract row 1 from a sheet fetched with includeGridData, shaped like a values.get row.
+
+    Empty cells become "" and trailing empty cells are dropped, as values.get does.
+    """
+    data = sheet.get("data") or [{}]
+    row_data = data[0].get("rowData") or [{}]
+    headers = [cell.get("formattedValue", "") for cell in row_data[0].get("values", [])]
+    while headers and headers[-1] == "":
+        headers.pop()
+    return headers
+
+
 # Friendly aliases for column number formats. Mapped to (Sheets API type, default pattern).
 _NUMBER_FORMAT_ALIASES: Dict[str, tuple] = {
     "TEXT":      ("TEXT",      "@"),
@@ -277,6 +792,47 @@ def _resolve_number_format(spec: Optional[str]) -> Optional[Dict[str, str]]:
     return {"type": type_, "pattern": pattern}
 
 
+# Largest pageSize accepted by drive.files.list
+_DRIVE_MAX_PAGE_SIZE = 1000
+
+
+async def _iter_spreadsheet_pages(service, max_results: int) -> AsyncIterator[List[Dict[str, Any]]]:
+    """
+    Yield pages of spreadsheet files from Drive, newest first, up to max_results files.
+
+    The request for the next page is started before the current page is yielded,
+    so its round trip overlaps with the caller's processing. A prefetched page the
+    caller never asks for is cancelled.
+    """
+    page_size = min(max_results, _DRIVE_MAX_PAGE_SIZE)
+
+    def _list_page(page_token: Optional[str]):
+        return asyncio.ensure_future(execute_async(
+            service.files()
+            .list(
+                q="mimeType='application/vnd.google-apps.spreadsheet'",
+                pageSize=page_size,
+                pageToken=page_token,
+                fields="nextPageToken,files(id,name,modifiedTime,webViewLink)",
+                orderBy="modifiedTime desc",
+            )
+        ))
+
+    pending = _list_page(None)
+    remaining = max_results
+    try:
+        while pending is not None:
+            response = await pending
+            page = response.get("files", [])[:remaining]
+            remaining -= len(page)
+            next_token = response.get("nextPageToken")
+            pending = _list_page(next_token) if next_token and remaining > 0 else None
+            yield page
+    finally:
+        if pending is not None:
+            pending.cancel()
+
+
 @server.tool()
 @handle_http_errors("list_spreadsheets", is_read_only=True, service_type="sheets")
 @require_google_service("drive", "drive_read")
@@ -291,36 +847,25 @@ async def list_spreadsheets(
     Args:
         user_google_email (str): The user's Google email address. Required.
         max_results (int): Maximum number of spreadsheets to return. Defaults to 25.
+            Values above 1000 are fetched across several pages.
 
     Returns:
         str: A formatted list of spreadsheet files (name, ID, modified time).
     """
     logger.info(f"[list_spreadsheets] Invoked. Email: '{user_google_email}'")
 
-    files_response = await asyncio.to_thread(
-        service.files()
-        .list(
-            q="mimeType='application/vnd.google-apps.spreadsheet'",
-            pageSize=max_results,
-            fields="files(id,name,modifiedTime,webViewLink)",
-            orderBy="modifiedTime desc",
-        )
-        .execute
-    )
-
-    files = files_response.get("files", [])
+    files: List[Dict[str, Any]] = []
+    async for page in _iter_spreadsheet_pages(service, max_results):
+        files.extend(page)
     if not files:
         return f"No spreadsheets found for {user_google_email}."
 
-    spreadsheets_list = [
+    lines = [f"Successfully listed {len(files)} spreadsheets for {user_google_email}:"]
+    lines.extend(
         f"- \"{file['name']}\" (ID: {file['id']}) | Modified: {file.get('modifiedTime', 'Unknown')} | Link: {file.get('webViewLink', 'No link')}"
         for file in files
-    ]
-
-    text_output = (
-        f"Successfully listed {len(files)} spreadsheets for {user_google_email}:\n"
-        + "\n".join(spreadsheets_list)
     )
+    text_output = "\n".join(lines)
 
     logger.info(f"Successfully listed {len(files)} spreadsheets for {user_google_email}.")
     return text_output
@@ -346,9 +891,7 @@ async def get_spreadsheet_info(
     """
     logger.info(f"[get_spreadsheet_info] Invoked. Email: '{user_google_email}', Spreadsheet ID: {spreadsheet_id}")
 
-    spreadsheet = await asyncio.to_thread(
-        service.spreadsheets().get(spreadsheetId=spreadsheet_id).execute
-    )
+    spreadsheet = await _get_spreadsheet_metadata(service, user_google_email, spreadsheet_id, fresh=True)
 
     title = spreadsheet.get("properties", {}).get("title", "Unknown")
     sheets = spreadsheet.get("sheets", [])
@@ -366,11 +909,12 @@ async def get_spreadsheet_info(
             f"  - \"{sheet_name}\" (ID: {sheet_id}) | Size: {rows}x{cols}"
         )
 
-    text_output = (
-        f"Spreadsheet: \"{title}\" (ID: {spreadsheet_id})\n"
-        f"Sheets ({len(sheets)}):\n"
-        + "\n".join(sheets_info) if sheets_info else "  No sheets found"
-    )
+    if sheets_info:
+        text_output = "\n".join(
+            [f"Spreadsheet: \"{title}\" (ID: {spreadsheet_id})", f"Sheets ({len(sheets)}):", *sheets_info]
+        )
+    else:
+        text_output = "  No sheets found"
 
     logger.info(f"Successfully retrieved info for spreadsheet {spreadsheet_id} for {user_google_email}.")
     return text_output
@@ -400,33 +944,37 @@ async def read_sheet_values(
     """
     logger.info(f"[read_sheet_values] Invoked. Email: '{user_google_email}', Spreadsheet: {spreadsheet_id}, Range: {range_name}, MaxDisplay: {max_display_rows}")
 
-    result = await asyncio.to_thread(
+    result = await _execute_sheets(
+        user_google_email,
         service.spreadsheets()
         .values()
         .get(spreadsheetId=spreadsheet_id, range=range_name)
-        .execute
     )
 
     values = result.get("values", [])
     if not values:
         return f"No data found in range '{range_name}' for {user_google_email}."
 
-    # Format the output as a readable table
-    formatted_rows = []
-    for i, row in enumerate(values, 1):
-        # Pad row with empty strings to show structure
-        padded_row = row + [""] * max(0, len(values[0]) - len(row)) if values else row
-        formatted_rows.append(f"Row {i:2d}: {padded_row}")
-
     # Determine how many rows to show
-    display_limit = len(formatted_rows) if max_display_rows == -1 else max_display_rows
-    show_all = max_display_rows == -1 or len(formatted_rows) <= max_display_rows
-    
-    text_output = (
-        f"Successfully read {len(values)} rows from range '{range_name}' in spreadsheet {spreadsheet_id} for {user_google_email}:\n"
-        + "\n".join(formatted_rows[:display_limit])
-        + ("" if show_all else f"\n... and {len(values) - display_limit} more rows")
+    display_limit = len(values) if max_display_rows == -1 else max_display_rows
+    show_all = max_display_rows == -1 or len(values) <= max_display_rows
+
+    # Format only the displayed rows as a readable table, padding each to the
+    # header width with empty strings to show structure. Rows are written straight
+    # into one buffer so unlimited reads don't hold a second list of formatted lines.
+    width = len(values[0])
+    buf = StringIO()
+    buf.write(
+        f"Successfully read {len(values)} rows from range '{range_name}' in spreadsheet {spreadsheet_id} for {user_google_email}:"
     )
+    displayed = values if display_limit >= len(values) else values[:display_limit]
+    if not displayed:
+        buf.write("\n")  # keep the blank line after the summary when no rows are shown
+    for i, row in enumerate(displayed, 1):
+        buf.write(f"\nRow {i:2d}: {row + [''] * (width - len(row)) if len(row) < width else row}")
+    if not show_all:
+        buf.write(f"\n... and {len(values) - display_limit} more rows")
+    text_output = buf.getvalue()
 
     logger.info(f"Successfully read {len(values)} rows for {user_google_email}.")
     return text_output
@@ -464,13 +1012,13 @@ async def modify_sheet_values(
     # Parse values if it's a JSON string (MCP passes parameters as JSON strings)
     if values is not None and isinstance(values, str):
         try:
-            parsed_values = _repair_json_string(values, context="modify_sheet_values")
+            parsed_values = await _parse_json_argument(values, context="modify_sheet_values")
             if not isinstance(parsed_values, list):
                 raise ValueError(f"Values must be a list, got {type(parsed_values).__name__}")
             # Validate it's a list of lists
-            for i, row in enumerate(parsed_values):
-                if not isinstance(row, list):
-                    raise ValueError(f"Row {i} must be a list, got {type(row).__name__}")
+            bad_row = _first_non_instance(parsed_values, list)
+            if bad_row is not None:
+                raise ValueError(f"Row {bad_row} must be a list, got {type(parsed_values[bad_row]).__name__}")
             values = parsed_values
             logger.info(f"[modify_sheet_values] Parsed JSON string to Python list with {len(values)} rows")
         except json.JSONDecodeError as e:
@@ -483,48 +1031,14 @@ async def modify_sheet_values(
     
     # Flatten any nested lists/arrays within cells and validate structure
     if not clear_values and values:
-        def flatten_cell_value(value, row_idx: int, col_idx: int):
-            """Convert nested lists/arrays to comma-separated strings, keep primitives as-is."""
-            if isinstance(value, (list, tuple)):
-                logger.warning(
-                    f"[modify_sheet_values] Found nested list at row {row_idx}, column {col_idx}. "
-                    f"Converting to comma-separated string: {value}"
-                )
-                # Recursively flatten and join with commas
-                flattened = []
-                for item in value:
-                    if isinstance(item, (list, tuple)):
-                        flattened.extend(flatten_cell_value(item, row_idx, col_idx))
-                    else:
-                        flattened.append(str(item) if item is not None else "")
-                return ", ".join(flattened)
-            elif isinstance(value, dict):
-                logger.warning(
-                    f"[modify_sheet_values] Found dict at row {row_idx}, column {col_idx}. "
-                    f"Converting to JSON string: {value}"
-                )
-                return json.dumps(value)
-            else:
-                # Primitive value (string, number, boolean, None)
-                return value
-        
-        # Flatten the values array
-        flattened_values = []
-        for i, row in enumerate(values):
-            flattened_row = []
-            for j, cell in enumerate(row):
-                flattened_cell = flatten_cell_value(cell, i, j)
-                flattened_row.append(flattened_cell)
-            flattened_values.append(flattened_row)
-        
-        values = flattened_values
+        values = _flatten_values(values, "modify_sheet_values")
 
     if clear_values:
-        result = await asyncio.to_thread(
+        result = await _execute_sheets(
+            user_google_email,
             service.spreadsheets()
             .values()
             .clear(spreadsheetId=spreadsheet_id, range=range_name)
-            .execute
         )
 
         cleared_range = result.get("clearedRange", range_name)
@@ -532,7 +1046,7 @@ async def modify_sheet_values(
         logger.info(f"Successfully cleared range '{cleared_range}' for {user_google_email}.")
     else:
         # Fix incorrectly encoded UTF-8 characters (e.g., c3a9 → é)
-        if not DISABLE_UTF8_FIX:
+        if not DISABLE_UTF8_FIX and _may_need_utf8_fix(values):
             values = fix_encoding_recursive(values, log_samples=True)
         
         # Chunking for large datasets to avoid timeouts and size limits
@@ -543,7 +1057,8 @@ async def modify_sheet_values(
         if total_rows <= CHUNK_SIZE:
             body = {"values": values}
 
-            result = await asyncio.to_thread(
+            result = await _execute_sheets(
+                user_google_email,
                 service.spreadsheets()
                 .values()
                 .update(
@@ -552,7 +1067,6 @@ async def modify_sheet_values(
                     valueInputOption=value_input_option,
                     body=body,
                 )
-                .execute
             )
 
             updated_cells = result.get("updatedCells", 0)
@@ -569,9 +1083,7 @@ async def modify_sheet_values(
             logger.info(f"[modify_sheet_values] Large dataset detected ({total_rows} rows). Using chunked update.")
             
             # Parse the range to get sheet name and starting position
-            # Format: "Sheet1!A1:Z100" or "A1:Z100"
-            import re
-            range_match = re.match(r"(?:([^!]+)!)?([A-Z]+)(\d+)(?::([A-Z]+)(\d+))?", range_name)
+            range_match = _A1_RANGE_RE.match(range_name)
             if not range_match:
                 raise Exception(f"Invalid range format: {range_name}. Expected format: 'Sheet1!A1' or 'A1:Z100'")
             
@@ -579,41 +1091,46 @@ async def modify_sheet_values(
             start_col = range_match.group(2)
             start_row = int(range_match.group(3))
             
-            total_cells_updated = 0
-            total_rows_updated = 0
             total_columns = len(values[0]) if values else 0
-            
-            for chunk_idx, chunk_start in enumerate(range(0, total_rows, CHUNK_SIZE)):
+            total_chunks = (total_rows + CHUNK_SIZE - 1) // CHUNK_SIZE
+
+            # One ValueRange per chunk, packed into as few values.batchUpdate requests
+            # as the request size limit allows (usually just one)
+            batches: List[List[Dict[str, Any]]] = [[]]
+            batch_bytes = 0
+            for chunk_start in range(0, total_rows, CHUNK_SIZE):
                 chunk = values[chunk_start : chunk_start + CHUNK_SIZE]
-                chunk_num = chunk_idx + 1
-                total_chunks = (total_rows + CHUNK_SIZE - 1) // CHUNK_SIZE
-                
-                # Calculate the range for this chunk
                 chunk_start_row = start_row + chunk_start
-                chunk_end_row = chunk_start_row + len(chunk) - 1
-                
                 if sheet_prefix:
                     chunk_range = f"{sheet_prefix}!{start_col}{chunk_start_row}"
                 else:
                     chunk_range = f"{start_col}{chunk_start_row}"
-                
-                logger.info(f"[modify_sheet_values] Processing chunk {chunk_num}/{total_chunks} ({len(chunk)} rows, range: {chunk_range})")
-                
-                body = {"values": chunk}
-                result = await asyncio.to_thread(
-                    service.spreadsheets()
-                    .values()
-                    .update(
-                        spreadsheetId=spreadsheet_id,
-                        range=chunk_range,
-                        valueInputOption=value_input_option,
-                        body=body,
+                chunk_bytes = _json_size(chunk)
+                if batches[-1] and batch_bytes + chunk_bytes > _VALUES_BATCH_MAX_BYTES:
+                    batches.append([])
+                    batch_bytes = 0
+                batches[-1].append({"range": chunk_range, "values": chunk})
+                batch_bytes += chunk_bytes
+
+            # Batches target disjoint row ranges, so they are written concurrently
+            batch_slots = asyncio.Semaphore(_MAX_CONCURRENT_CHUNK_WRITES)
+
+            async def _update_batch(batch_num: int, data: List[Dict[str, Any]]) -> Dict[str, Any]:
+                async with batch_slots:
+                    logger.info(
+                        "[modify_sheet_values] Sending request %d/%d (%d chunks, ranges: %s..%s)",
+                        batch_num, len(batches), len(data), data[0]["range"], data[-1]["range"],
                     )
-                    .execute
-                )
-                
-                total_cells_updated += result.get("updatedCells", 0)
-                total_rows_updated += result.get("updatedRows", 0)
+                    return await _execute_sheets(
+                        user_google_email,
+                        _values_batch_update_request(service, spreadsheet_id, data, value_input_option),
+                    )
+
+            results = await asyncio.gather(*(
+                _update_batch(batch_num, data) for batch_num, data in enumerate(batches, 1)
+            ))
+            total_cells_updated = sum(result.get("totalUpdatedCells", 0) for result in results)
+            total_rows_updated = sum(result.get("totalUpdatedRows", 0) for result in results)
             
             text_output = (
                 f"Successfully updated range '{range_name}' in spreadsheet {spreadsheet_id} for {user_google_email}. "
@@ -657,12 +1174,12 @@ async def append_sheet_values(
     # Parse values if it's a JSON string (MCP passes parameters as JSON strings)
     if values is not None and isinstance(values, str):
         try:
-            parsed_values = _repair_json_string(values, context="append_sheet_values")
+            parsed_values = await _parse_json_argument(values, context="append_sheet_values")
             if not isinstance(parsed_values, list):
                 raise ValueError(f"Values must be a list, got {type(parsed_values).__name__}")
-            for i, row in enumerate(parsed_values):
-                if not isinstance(row, list):
-                    raise ValueError(f"Row {i} must be a list, got {type(row).__name__}")
+            bad_row = _first_non_instance(parsed_values, list)
+            if bad_row is not None:
+                raise ValueError(f"Row {bad_row} must be a list, got {type(parsed_values[bad_row]).__name__}")
             values = parsed_values
             logger.info(
                 f"[append_sheet_values] Parsed JSON string to Python list with {len(values)} rows"
@@ -676,65 +1193,26 @@ async def append_sheet_values(
         raise Exception("'values' must be provided and be a non-empty 2D array.")
     
     # Flatten any nested lists/arrays within cells and validate structure
-    def flatten_cell_value(value, row_idx: int, col_idx: int):
-        """Convert nested lists/arrays to comma-separated strings, keep primitives as-is."""
-        if isinstance(value, (list, tuple)):
-            logger.warning(
-                f"[append_sheet_values] Found nested list at row {row_idx}, column {col_idx}. "
-                f"Converting to comma-separated string: {value}"
-            )
-            # Recursively flatten and join with commas
-            flattened = []
-            for item in value:
-                if isinstance(item, (list, tuple)):
-                    flattened.extend(flatten_cell_value(item, row_idx, col_idx))
-                else:
-                    flattened.append(str(item) if item is not None else "")
-            return ", ".join(flattened)
-        elif isinstance(value, dict):
-            logger.warning(
-                f"[append_sheet_values] Found dict at row {row_idx}, column {col_idx}. "
-                f"Converting to JSON string: {value}"
-            )
-            return json.dumps(value)
-        else:
-            # Primitive value (string, number, boolean, None)
-            return value
-    
-    # Flatten the values array
-    flattened_values = []
-    for i, row in enumerate(values):
-        flattened_row = []
-        for j, cell in enumerate(row):
-            flattened_cell = flatten_cell_value(cell, i, j)
-            flattened_row.append(flattened_cell)
-        flattened_values.append(flattened_row)
-    
-    values = flattened_values
+    values = _flatten_values(values, "append_sheet_values")
 
     # Fix incorrectly encoded UTF-8 characters (e.g., c3a9 → é)
-    if not DISABLE_UTF8_FIX:
+    if not DISABLE_UTF8_FIX and _may_need_utf8_fix(values):
         values = fix_encoding_recursive(values, log_samples=True)
 
-    # Chunking for large datasets to avoid timeouts and size limits
-    CHUNK_SIZE = 5000  # rows per request
+    # Split only payloads over the request size budget; most fit in one append
+    chunks = _split_by_json_size(values, _VALUES_BATCH_MAX_BYTES)
     total_rows = len(values)
-    
+    total_chunks = len(chunks)
+
     # For small datasets, use single append call (more efficient)
-    if total_rows <= CHUNK_SIZE:
-        body = {"values": values}
-        result = await asyncio.to_thread(
-            service.spreadsheets()
-            .values()
-            .append(
-                spreadsheetId=spreadsheet_id,
-                range=range_name,
-                valueInputOption=value_input_option,
-                insertDataOption=insert_data_option,
-                body=body,
-            )
-            .execute
+    if total_chunks == 1:
+        result = await _execute_sheets(
+            user_google_email,
+            _values_append_request(
+                service, spreadsheet_id, range_name, values, value_input_option, insert_data_option
+            ),
         )
+        _invalidate_spreadsheet_metadata(user_google_email, spreadsheet_id)
 
         updates = result.get("updates", {})
         updated_range = updates.get("updatedRange", range_name)
@@ -758,25 +1236,16 @@ async def append_sheet_values(
     total_cells_appended = 0
     last_updated_range = range_name
     
-    for chunk_idx, start in enumerate(range(0, total_rows, CHUNK_SIZE)):
-        chunk = values[start : start + CHUNK_SIZE]
-        chunk_num = chunk_idx + 1
-        total_chunks = (total_rows + CHUNK_SIZE - 1) // CHUNK_SIZE
-        
-        logger.info(f"[append_sheet_values] Processing chunk {chunk_num}/{total_chunks} ({len(chunk)} rows)")
+    for chunk_num, chunk in enumerate(chunks, 1):
+        logger.info(
+            "[append_sheet_values] Processing chunk %d/%d (%d rows)", chunk_num, total_chunks, len(chunk)
+        )
         
-        body = {"values": chunk}
-        result = await asyncio.to_thread(
-            service.spreadsheets()
-            .values()
-            .append(
-                spreadsheetId=spreadsheet_id,
-                range=range_name,
-                valueInputOption=value_input_option,
-                insertDataOption=insert_data_option,
-                body=body,
-            )
-            .execute
+        result = await _execute_sheets(
+            user_google_email,
+            _values_append_request(
+                service, spreadsheet_id, range_name, chunk, value_input_option, insert_data_option
+            ),
         )
         
         updates = result.get("updates", {})
@@ -785,6 +1254,7 @@ async def append_sheet_values(
         total_rows_appended += updated_rows
         total_cells_appended += updated_cells
         last_updated_range = updates.get("updatedRange", last_updated_range)
+    _invalidate_spreadsheet_metadata(user_google_email, spreadsheet_id)
     
     text_output = (
         f"Successfully appended to '{last_updated_range}' in spreadsheet {spreadsheet_id} for {user_google_email}. "
@@ -819,8 +1289,13 @@ async def append_rows_by_headers(
     from the union of provided row keys. If new keys appear, extends the header row
     (creating new columns) and maps values accordingly.
 
-    NOTE on date/number behaviour: this tool writes via `spreadsheets.values.update`,
-    which does NOT touch existing cell formats. With `valueInputOption=USER_ENTERED`,
+    Rows are added with `spreadsheets.values.append` anchored on the header row, so
+    they go after the last row of the table that starts at the header. A completely
+    blank row ends that table: rows below such a gap are not seen as part of it, and
+    new rows are inserted above them (never overwriting them).
+
+    NOTE on date/number behaviour: `spreadsheets.values.append` does NOT touch
+    existing cell formats. With `valueInputOption=USER_ENTERED`,
     Google Sheets honours any pre-existing number format on the target cells (e.g. a
     sticky "@"/Plain-text format from a prior run will store an ISO date as a literal
     string instead of parsing it). If you re-use the same spreadsheet across runs and
@@ -874,7 +1349,7 @@ async def append_rows_by_headers(
     # Parse rows if provided as JSON string (with automatic repair of common LLM errors)
     if rows is not None and isinstance(rows, str):
         try:
-            parsed_rows = _repair_json_string(rows, context="append_rows_by_headers")
+            parsed_rows = await _parse_json_argument(rows, context="append_rows_by_headers")
             rows = parsed_rows
             logger.info(
                 f"[append_rows_by_headers] Parsed JSON string to Python list with {len(rows) if isinstance(rows, list) else 0} items"
@@ -945,14 +1420,18 @@ async def append_rows_by_headers(
     logger.info(f"[append_rows_by_headers] Processing {len(rows)} rows")
 
     # Validate list elements are dict-like
-    for i, item in enumerate(rows):
-        if not isinstance(item, dict):
-            raise Exception(f"Row {i} must be an object keyed by header names.")
+    bad_row = _first_non_instance(rows, dict)
+    if bad_row is not None:
+        raise Exception(f"Row {bad_row} must be an object keyed by header names.")
 
     # Fix incorrectly encoded UTF-8 characters (e.g., c3a9 → é)
-    if not DISABLE_UTF8_FIX:
+    if not DISABLE_UTF8_FIX and _may_need_utf8_fix(rows):
         rows = fix_encoding_recursive(rows, log_samples=True)
 
+    # Build the resource chain once and reuse it for every request below
+    spreadsheets_api = service.spreadsheets()
+    values_api = spreadsheets_api.values()
+
     # 1) Read existing header row.
     # If `create_sheet_if_missing=True` (default), transparently create the
     # target tab via addSheet when the first read fails because the tab does
@@ -963,16 +1442,22 @@ async def append_rows_by_headers(
     # both an HTTP 400/404 status AND a message that looks like a missing-
     # sheet error, so unrelated 4xx (auth, quota, invalid spreadsheet id)
     # still propagate untouched.
-    async def _read_header_row():
-        return await asyncio.to_thread(
-            service.spreadsheets()
-            .values()
-            .get(spreadsheetId=spreadsheet_id, range=f"{sheet_name}!1:1")
-            .execute
+    # A single spreadsheets.get scoped to row 1 returns both the sheet metadata
+    # (sheetId, grid size) and the header cells.
+    async def _read_sheet_and_header_row():
+        return await _execute_sheets(
+            user_google_email,
+            spreadsheets_api.get(
+                spreadsheetId=spreadsheet_id,
+                ranges=[f"{sheet_name}!1:1"],
+                includeGridData=True,
+                fields=_SHEET_WITH_HEADER_FIELDS,
+            )
         )
 
+    sheet_created = False
     try:
-        header_result = await _read_header_row()
+        spreadsheet_meta = await _read_sheet_and_header_row()
     except HttpError as e:
         msg = str(e)
         status = getattr(e, "status_code", None) or getattr(
@@ -988,72 +1473,44 @@ async def append_rows_by_headers(
             f"[append_rows_by_headers] Sheet '{sheet_name}' missing in spreadsheet "
             f"{spreadsheet_id} — auto-creating (create_sheet_if_missing=True)."
         )
-        await asyncio.to_thread(
-            service.spreadsheets()
-            .batchUpdate(
-                spreadsheetId=spreadsheet_id,
-                body={"requests": [{"addSheet": {"properties": {"title": sheet_name}}}]},
+        await _execute_sheets(
+            user_google_email,
+            _batch_update_request(
+                service, spreadsheet_id, [{"addSheet": {"properties": {"title": sheet_name}}}]
             )
-            .execute
         )
-        header_result = await _read_header_row()
+        sheet_created = True
+        _invalidate_spreadsheet_metadata(user_google_email, spreadsheet_id)
+        spreadsheet_meta = await _read_sheet_and_header_row()
 
-    existing_header_values = header_result.get("values", [])
-    existing_headers: List[str] = existing_header_values[0] if existing_header_values else []
+    meta_sheets = spreadsheet_meta.get("sheets", [])
+    target_sheet = meta_sheets[0] if meta_sheets else None
+    existing_headers: List[str] = _header_row_from_grid(target_sheet) if target_sheet else []
 
-    # 2) Compute union of headers
-    provided_keys: List[str] = []
-    seen = set()
+    # 2) Compute union of headers (existing order first, then new keys in first-seen order)
+    all_headers: List[str] = list(existing_headers)
+    headers_set = set(all_headers)
     for item in rows:
-        for k in item.keys():
-            if k not in seen:
-                seen.add(k)
-                provided_keys.append(k)
-
-    all_headers: List[str] = list(existing_headers) if existing_headers else []
-    for k in provided_keys:
-        if k not in all_headers:
-            all_headers.append(k)
-
-    # 3) If no headers and permitted, or if new headers present, update header row
-    need_write_headers = (not existing_headers and write_headers_if_missing) or (
-        existing_headers and len(all_headers) > len(existing_headers)
+        for k in item:
+            if k not in headers_set:
+                headers_set.add(k)
+                all_headers.append(k)
+
+    # 3) Write the header row only when it would change: the sheet has none (and
+    #    writing is permitted) or the rows introduce new keys. Repeated appends with
+    #    the same schema skip the write, leaving one get + one append on the hot path.
+    need_write_headers = all_headers != existing_headers and (
+        write_headers_if_missing or bool(existing_headers)
     )
-    
-    headers_were_written = False
-    if need_write_headers:
-        await asyncio.to_thread(
-            service.spreadsheets()
-            .values()
-            .update(
-                spreadsheetId=spreadsheet_id,
-                range=f"{sheet_name}!1:1",
-                valueInputOption=value_input_option,
-                body={"values": [all_headers]},
-            )
-            .execute
-        )
-        headers_were_written = True
-        logger.info(
-            f"[append_rows_by_headers] Header row set/extended to {len(all_headers)} columns."
-        )
+    # The header row itself is written in step 7, once the grid has room for it.
 
     if not all_headers:
         raise Exception(
             "No headers exist and write_headers_if_missing is False; cannot map rows."
         )
 
-    # 3b) Resolve target sheet metadata once — needed for sheetId-scoped requests
+    # 3b) Target sheet metadata from step 1 — needed for sheetId-scoped requests
     #     (clear / format) and reused later for grid expansion.
-    spreadsheet_meta = await asyncio.to_thread(
-        service.spreadsheets().get(spreadsheetId=spreadsheet_id).execute
-    )
-    target_sheet = None
-    for s in spreadsheet_meta.get("sheets", []):
-        if s.get("properties", {}).get("title") == sheet_name:
-            target_sheet = s
-            break
-
     target_sheet_id: Optional[int] = None
     current_max_rows = 1000
     current_max_cols = 26
@@ -1063,21 +1520,25 @@ async def append_rows_by_headers(
         current_max_cols = grid_props.get("columnCount", 26)
         target_sheet_id = target_sheet["properties"]["sheetId"]
 
+    # Steps 3c and 3d touch cell values and number formats respectively, so they
+    # are independent and their requests are sent concurrently.
+    setup_calls: List[Awaitable[Any]] = []
+
     # 3c) Optional reset: wipe every data row (everything below the header) so the
-    #     next_row scan starts at row 2 and no stale values/formats from previous
-    #     runs can leak into the new write.
+    #     append starts at row 2 and no stale values/formats from previous
+    #     runs can leak into the new write. Columns not yet in the grid hold no
+    #     data, so the range is clamped to the current grid width.
     if reset_existing_rows:
-        end_col_letter = _col_idx_to_letter(max(len(all_headers) - 1, 0))
+        clear_cols = min(len(all_headers), current_max_cols)
+        end_col_letter = _col_idx_to_letter(max(clear_cols - 1, 0))
         clear_range = f"{sheet_name}!A2:{end_col_letter}{current_max_rows}"
         logger.info(
             f"[append_rows_by_headers] reset_existing_rows=True — clearing data range {clear_range}"
         )
-        await asyncio.to_thread(
-            service.spreadsheets()
-            .values()
-            .clear(spreadsheetId=spreadsheet_id, range=clear_range)
-            .execute
-        )
+        setup_calls.append(_execute_sheets(
+            user_google_email,
+            values_api.clear(spreadsheetId=spreadsheet_id, range=clear_range)
+        ))
 
     # 3d) Optional column-format management. Done BEFORE writing values so that
     #     USER_ENTERED parses each cell against the format we just set (critical
@@ -1092,7 +1553,7 @@ async def append_rows_by_headers(
                     f"column_formats must be a dict mapping header -> format spec, got {type(column_formats).__name__}"
                 )
             for header_name, spec in column_formats.items():
-                if header_name not in all_headers:
+                if header_name not in headers_set:
                     logger.warning(
                         f"[append_rows_by_headers] column_formats key '{header_name}' "
                         f"is not among the sheet headers {all_headers}; ignored."
@@ -1124,8 +1585,11 @@ async def append_rows_by_headers(
                     }
                 )
 
+        header_index: Dict[str, int] = {}
+        for i, h in enumerate(all_headers):
+            header_index.setdefault(h, i)  # first occurrence wins, like list.index
         for header_name, number_format in normalized_formats.items():
-            col_idx = all_headers.index(header_name)
+            col_idx = header_index[header_name]
             format_requests.append(
                 {
                     "repeatCell": {
@@ -1151,14 +1615,13 @@ async def append_rows_by_headers(
                 f"(clear_column_format={clear_column_format}, "
                 f"column_formats={list(normalized_formats.keys()) if normalized_formats else []})"
             )
-            await asyncio.to_thread(
-                service.spreadsheets()
-                .batchUpdate(
-                    spreadsheetId=spreadsheet_id,
-                    body={"requests": format_requests},
-                )
-                .execute
-            )
+            setup_calls.append(_execute_sheets(
+                user_google_email,
+                _batch_update_request(service, spreadsheet_id, format_requests)
+            ))
+
+    if setup_calls:
+        await asyncio.gather(*setup_calls)
 
     # 4) Map input objects to row lists aligned with all_headers,
     #    flattening any nested lists/dicts to sheet-safe primitives
@@ -1175,117 +1638,126 @@ async def append_rows_by_headers(
                     flat_parts.append(str(v) if v is not None else "")
             result = ", ".join(flat_parts)
             logger.debug(
-                f"[append_rows_by_headers] Flattened list at row {row_idx}, col {col_idx}: {value!r:.80} -> {result!r:.80}"
+                "[append_rows_by_headers] Flattened list at row %d, col %d: %.80r -> %.80r",
+                row_idx, col_idx, value, result,
             )
             return result
         elif isinstance(value, dict):
             return json.dumps(value)
         return value
 
+    # itemgetter pulls every header's value in one C-level call; rows missing some
+    # headers are filled from `defaults` first. Only nested values need flattening.
+    get_cells = itemgetter(*all_headers)
+    single_column = len(all_headers) == 1
+    defaults = dict.fromkeys(all_headers, "")
+    nested_types = (list, tuple, dict)
+
     values_to_append: List[List[Any]] = []
     for i, item in enumerate(rows):
-        mapped_row = [_flatten_cell(item.get(h, ""), i, j) for j, h in enumerate(all_headers)]
+        try:
+            cells = get_cells(item)
+        except KeyError:
+            cells = get_cells({**defaults, **item})
+        if single_column:
+            cells = (cells,)
+        if _PRIMITIVE_CELL_TYPES.issuperset(map(type, cells)):
+            mapped_row = list(cells)
+        else:
+            mapped_row = [
+                _flatten_cell(v, i, j) if isinstance(v, nested_types) else v
+                for j, v in enumerate(cells)
+            ]
         values_to_append.append(mapped_row)
 
-    # 5) Append rows at the end of the sheet
-    # Determine next available row by scanning column A
-    col_a_values = await asyncio.to_thread(
-        service.spreadsheets()
-        .values()
-        .get(spreadsheetId=spreadsheet_id, range=f"{sheet_name}!A:A", majorDimension="ROWS")
-        .execute
-    )
-    existing_rows = len(col_a_values.get("values", [])) if col_a_values.get("values") else 0
-    
-    # If we have headers (either just written or already existing), ensure we account for row 1
-    # This handles:
-    # 1. Race condition where just-written headers aren't reflected in the read
-    # 2. Existing headers where column A of row 1 is empty (header starts at column B+)
-    if all_headers and existing_rows == 0:
-        # Headers exist but column A appears empty - data should start at row 2
-        existing_rows = 1
-        logger.info("[append_rows_by_headers] Adjusted existing_rows to 1 to account for header row.")
-    
-    # If sheet has headers, existing_rows >= 1; next_row is existing_rows + 1
-    next_row = max(2, existing_rows + 1)  # Never write data to row 1 when we have headers
-
-    # 6) Auto-expand the sheet grid if needed (.update() cannot write beyond grid limits).
+    # 5) Auto-expand the sheet grid if new header columns do not fit.
+    #    Rows need no expansion: values.append adds them as needed.
     #    Reuses the metadata already fetched in step 3b — neither values.clear() nor
     #    repeatCell/updateCells changes the grid dimensions, so the cached values
-    #    (target_sheet_id, current_max_rows, current_max_cols) are still accurate.
-    required_rows = next_row + len(values_to_append) - 1  # last row we'll write to
+    #    (target_sheet_id, current_max_cols) are still accurate.
     required_cols = len(all_headers)
 
-    if target_sheet_id is not None:
-        expand_requests = []
-
-        if required_rows > current_max_rows:
-            rows_to_add = required_rows - current_max_rows + 100  # add 100 extra buffer
-            logger.info(
-                f"[append_rows_by_headers] Sheet grid has {current_max_rows} rows but need {required_rows}. "
-                f"Expanding by {rows_to_add} rows."
-            )
-            expand_requests.append({
-                "appendDimension": {
-                    "sheetId": target_sheet_id,
-                    "dimension": "ROWS",
-                    "length": rows_to_add,
-                }
-            })
-
-        if required_cols > current_max_cols:
-            cols_to_add = required_cols - current_max_cols + 5  # add 5 extra buffer
-            logger.info(
-                f"[append_rows_by_headers] Sheet grid has {current_max_cols} cols but need {required_cols}. "
-                f"Expanding by {cols_to_add} columns."
-            )
-            expand_requests.append({
+    if target_sheet_id is not None and required_cols > current_max_cols:
+        cols_to_add = required_cols - current_max_cols + 5  # add 5 extra buffer
+        logger.info(
+            f"[append_rows_by_headers] Sheet grid has {current_max_cols} cols but need {required_cols}. "
+            f"Expanding by {cols_to_add} columns."
+        )
+        await _execute_sheets(
+            user_google_email,
+            _batch_update_request(service, spreadsheet_id, [{
                 "appendDimension": {
                     "sheetId": target_sheet_id,
                     "dimension": "COLUMNS",
                     "length": cols_to_add,
                 }
-            })
-
-        if expand_requests:
-            await asyncio.to_thread(
-                service.spreadsheets()
-                .batchUpdate(
-                    spreadsheetId=spreadsheet_id,
-                    body={"requests": expand_requests},
-                )
-                .execute
+            }])
+        )
+        logger.info(f"[append_rows_by_headers] Sheet grid expanded successfully.")
+
+    # 6) Write the header row before appending, so the append below finds the table
+    #    from row 1 and never lands on the header row. When the header columns are
+    #    known to be empty (sheet just created, or data rows just cleared), the header
+    #    is instead sent as the first row of the append — one round trip instead of two.
+    header_in_append = need_write_headers and not existing_headers and (
+        sheet_created or reset_existing_rows
+    )
+    if header_in_append:
+        values_to_append = [all_headers, *values_to_append]
+    elif need_write_headers:
+        await _execute_sheets(
+            user_google_email,
+            values_api.update(
+                spreadsheetId=spreadsheet_id,
+                range=f"{sheet_name}!1:1",
+                valueInputOption=value_input_option,
+                body={"values": [all_headers]},
             )
-            logger.info(f"[append_rows_by_headers] Sheet grid expanded successfully.")
+        )
+        logger.info(
+            f"[append_rows_by_headers] Header row set/extended to {len(all_headers)} columns."
+        )
 
-    CHUNK_SIZE = 5000  # rows per request to avoid large payload timeouts
+    # 7) Append rows after the table. Sheets locates the last row itself, atomically,
+    #    so there is no column A read and concurrent calls cannot overwrite each other.
+    #    The range is anchored on the header row, which is known to be part of the
+    #    table; a sheet without a header row is anchored on row 2 so data never lands
+    #    in row 1. Rows are inserted (INSERT_ROWS), so anything below a blank row is
+    #    pushed down rather than overwritten. Only when every row below the header is
+    #    known to be empty are the existing empty rows filled instead (OVERWRITE), so
+    #    repeated resets do not keep growing the grid.
+    #    All rows go in one request unless the body would exceed the size budget; the
+    #    slices are then appended in order, each landing after the previous one.
+    anchor_row = 1 if existing_headers or need_write_headers else 2
+    last_col_letter = _col_idx_to_letter(len(all_headers) - 1)
+    append_range = f"{sheet_name}!A{anchor_row}:{last_col_letter}{anchor_row}"
+    insert_data_option = "OVERWRITE" if sheet_created or reset_existing_rows else "INSERT_ROWS"
     total_rows_appended = 0
     total_cells_appended = 0
-    last_updated_range = f"{sheet_name}!A{next_row}"
+    last_updated_range = append_range
+
+    for chunk in _split_by_json_size(values_to_append, _VALUES_BATCH_MAX_BYTES):
+        append_result = await _execute_sheets(
+            user_google_email,
+            _values_append_request(
+                service, spreadsheet_id, append_range, chunk, value_input_option, insert_data_option
+            ),
+        )
 
-    for start in range(0, len(values_to_append), CHUNK_SIZE):
-        chunk = values_to_append[start : start + CHUNK_SIZE]
-        # Compute the A1 range for this chunk starting row
-        start_row_for_chunk = next_row + total_rows_appended
-        target_range = f"{sheet_name}!A{start_row_for_chunk}"
+        updates = append_result.get("updates", {})
+        total_rows_appended += updates.get("updatedRows", len(chunk))
+        total_cells_appended += updates.get("updatedCells", len(chunk) * len(all_headers))
+        last_updated_range = updates.get("updatedRange", last_updated_range)
 
-        update_result = await asyncio.to_thread(
-            service.spreadsheets()
-            .values()
-            .update(
-                spreadsheetId=spreadsheet_id,
-                range=target_range,
-                valueInputOption=value_input_option,
-                body={"values": chunk},
-            )
-            .execute
+    if header_in_append:
+        total_rows_appended -= 1
+        total_cells_appended -= len(all_headers)
+        logger.info(
+            f"[append_rows_by_headers] Header row set to {len(all_headers)} columns with the first append."
         )
 
-        updated_rows = update_result.get("updatedRows", len(chunk))
-        updated_cells = update_result.get("updatedCells", len(chunk) * len(all_headers))
-        total_rows_appended += updated_rows
-        total_cells_appended += updated_cells
-        last_updated_range = update_result.get("updatedRange", target_range)
+    # The sheet may have been created, widened or grown by appended rows
+    _invalidate_spreadsheet_metadata(user_google_email, spreadsheet_id)
 
     return (
         f"Headers: {len(all_headers)} columns. Appended {total_rows_appended} rows / {total_cells_appended} cells to '{last_updated_range}'."
@@ -1338,62 +1810,129 @@ async def create_spreadsheet(
             {"properties": {"title": sheet_name}} for sheet_name in sheet_names
         ]
 
-    spreadsheet = await asyncio.to_thread(
-        sheets_service.spreadsheets().create(body=spreadsheet_body).execute
-    )
+    # Folder lookup only needs Drive, so it can run while the spreadsheet is being
+    # created. It never creates folders: missing ones are only created once the
+    # spreadsheet exists, so a failed create leaves nothing behind.
+    async def _find_target_folder() -> Optional[Dict[str, Any]]:
+        # Priority 1: folder_path (navigate through nested folders)
+        if folder_path:
+            return await find_or_create_folder_path(
+                drive_service,
+                folder_path,
+                root_folder_id=search_within_folder_id,
+                create_missing=False,
+                user_email=user_google_email
+            )
 
-    spreadsheet_id = spreadsheet.get("spreadsheetId")
-    spreadsheet_url = spreadsheet.get("spreadsheetUrl")
-    
-    # Handle folder placement
-    folder_info = ""
-    target_folder_id = folder_id
-    folder_name = None
-    
-    # Priority 1: folder_path (navigate through nested folders)
-    if folder_path and not folder_id:
-        from gdrive.drive_helpers import find_or_create_folder_path
-        folder_result = await find_or_create_folder_path(
-            drive_service,
-            folder_path,
-            root_folder_id=search_within_folder_id,
-            create_missing=create_folders_if_missing
-        )
-        if folder_result:
-            target_folder_id = folder_result['id']
-            folder_info = f" | Path: {folder_result['path_summary']}"
-        else:
-            folder_info = f" | Warning: Could not navigate folder path {' > '.join(folder_path)}, created in My Drive"
-    
-    # Priority 2: folder_name_contains (simple search)
-    elif folder_name_contains and not folder_id:
-        from gdrive.drive_helpers import find_folder_by_name_pattern
-        folder = await find_folder_by_name_pattern(
+        # Priority 2: folder_name_contains (simple search)
+        return await find_folder_by_name_pattern(
             drive_service,
             folder_name_contains,
             exact_match=False,
             user_email=user_google_email,
             parent_folder_id=search_within_folder_id
         )
-        if folder:
-            target_folder_id = folder['id']
-            folder_name = folder['name']
-            search_scope = f" within folder {search_within_folder_id}" if search_within_folder_id else ""
-            folder_info = f" | Folder: '{folder['name']}' ({folder['id']}){search_scope}"
-        else:
-            search_scope = f" within folder {search_within_folder_id}" if search_within_folder_id else " in all Drive"
-            folder_info = f" | Warning: No folder found matching '{folder_name_contains}'{search_scope}, created in My Drive"
-    
-    if target_folder_id:
-        from gdrive.drive_helpers import move_file_to_folder
-        move_success = await move_file_to_folder(
-            drive_service,
-            spreadsheet_id,
-            target_folder_id,
-            file_name=title
+
+    needs_lookup = bool(folder_path or folder_name_contains) and not folder_id
+    folder: Optional[Dict[str, Any]] = None
+    folder_info = ""
+    target_folder_id = None
+
+    # With default sheets and an existing target folder, Drive creates the spreadsheet
+    # directly inside it: one request instead of spreadsheets.create followed by a move.
+    # (Resolving concurrently with spreadsheets.create and then moving never takes fewer
+    # round trips, and takes one more when the folder lookup is cached.) If Drive refuses
+    # (e.g. the folder is gone), fall back to create + move below, which still creates
+    # the spreadsheet in My Drive.
+    spreadsheet_id = None
+    folder_looked_up = False
+    if not sheet_names and (folder_id or needs_lookup):
+        if needs_lookup:
+            folder = await _find_target_folder()
+            folder_looked_up = True
+        create_in = folder_id or (folder["id"] if folder else None)
+        if create_in:
+            try:
+                created = await execute_async(
+                    drive_service.files().create(
+                        body={
+                            "name": title,
+                            "mimeType": "application/vnd.google-apps.spreadsheet",
+                            "parents": [create_in],
+                        },
+                        fields="id",
+                        supportsAllDrives=True,
+                    )
+                )
+            except HttpError as e:
+                logger.warning(
+                    f"[create_spreadsheet] Drive create in folder {create_in} failed ({e}); "
+                    "falling back to spreadsheets.create and move."
+                )
+                if folder_path and not folder_id:
+                    # The folder may have come from the path cache and no longer exist
+                    uncache_folder_path(user_google_email, folder_path, search_within_folder_id or "root")
+                    folder = None
+            else:
+                spreadsheet_id = created["id"]
+                spreadsheet_url = f"https://docs.google.com/spreadsheets/d/{spreadsheet_id}/edit"
+                target_folder_id = create_in
+                if folder_id:
+                    folder_info = f" | Created in folder: {folder_id}"
+                elif folder_path:
+                    folder_info = f" | Path: {folder['path_summary']}"
+                else:
+                    search_scope = f" within folder {search_within_folder_id}" if search_within_folder_id else ""
+                    folder_info = f" | Folder: '{folder['name']}' ({folder['id']}){search_scope}"
+
+    if spreadsheet_id is None:
+        create_request = _execute_sheets(
+            user_google_email,
+            sheets_service.spreadsheets().create(body=spreadsheet_body)
         )
-        if move_success and not folder_info:
-            folder_info = f" | Moved to folder: {target_folder_id}"
+        if needs_lookup and not folder_looked_up:
+            spreadsheet, folder = await asyncio.gather(create_request, _find_target_folder())
+        else:
+            spreadsheet = await create_request
+
+        spreadsheet_id = spreadsheet.get("spreadsheetId")
+        spreadsheet_url = spreadsheet.get("spreadsheetUrl")
+
+        # spreadsheets.create does not return the new file's parents, so the moves look
+        # them up rather than assuming the My Drive root
+        if folder_id:
+            target_folder_id = folder_id
+            if await move_file_to_folder(
+                drive_service, spreadsheet_id, folder_id, file_name=title
+            ):
+                folder_info = f" | Moved to folder: {folder_id}"
+        elif folder_path:
+            folder = await move_file_to_folder_path(
+                drive_service,
+                spreadsheet_id,
+                folder_path,
+                root_folder_id=search_within_folder_id,
+                create_missing=create_folders_if_missing,
+                user_email=user_google_email,
+                file_name=title,
+                resolved_folder=folder,
+            )
+            if folder:
+                target_folder_id = folder["id"]
+                folder_info = f" | Path: {folder['path_summary']}"
+            else:
+                folder_info = f" | Warning: Could not navigate folder path {' > '.join(folder_path)}, created in My Drive"
+        elif folder_name_contains:
+            if folder:
+                target_folder_id = folder["id"]
+                if await move_file_to_folder(
+                    drive_service, spreadsheet_id, folder["id"], file_name=title
+                ):
+                    search_scope = f" within folder {search_within_folder_id}" if search_within_folder_id else ""
+                    folder_info = f" | Folder: '{folder['name']}' ({folder['id']}){search_scope}"
+            else:
+                search_scope = f" within folder {search_within_folder_id}" if search_within_folder_id else " in all Drive"
+                folder_info = f" | Warning: No folder found matching '{folder_name_contains}'{search_scope}, created in My Drive"
 
     # Create human-readable message
     message = f"Successfully created spreadsheet '{title}' for {user_google_email}.{folder_info}"
@@ -1433,25 +1972,21 @@ async def create_sheet(
     """
     logger.info(f"[create_sheet] Invoked. Email: '{user_google_email}', Spreadsheet: {spreadsheet_id}, Sheet: {sheet_name}")
 
-    request_body = {
-        "requests": [
-            {
-                "addSheet": {
-                    "properties": {
-                        "title": sheet_name
-                    }
+    requests = [
+        {
+            "addSheet": {
+                "properties": {
+                    "title": sheet_name
                 }
             }
-        ]
-    }
+        }
+    ]
 
-    response = await asyncio.to_thread(
-        service.spreadsheets()
-        .batchUpdate(spreadsheetId=spreadsheet_id, body=request_body)
-        .execute
-    )
+    # Tabs added concurrently to the same spreadsheet share one batchUpdate
+    replies = await _coalesced_batch_update(service, user_google_email, spreadsheet_id, requests)
 
-    sheet_id = response["replies"][0]["addSheet"]["properties"]["sheetId"]
+    _invalidate_spreadsheet_metadata(user_google_email, spreadsheet_id)
+    sheet_id = replies[0]["addSheet"]["properties"]["sheetId"]
 
     text_output = (
         f"Successfully created sheet '{sheet_name}' (ID: {sheet_id}) in spreadsheet {spreadsheet_id} for {user_google_email}."
@@ -1490,6 +2025,8 @@ async def deduplicate_rows_by_headers(
     Fast path based on Sheets server-side operations:
       1) Sort rows (excluding header) by the sort column (DESC for max, ASC for min)
       2) Delete duplicates comparing only the key columns (keeps first occurrence)
+    If sort_header is itself a key header, duplicates share its value, so step 1 is
+    skipped and the remaining rows keep their original order.
 
     Args:
         user_google_email: The user's Google email address. Required.
@@ -1521,131 +2058,175 @@ async def deduplicate_rows_by_headers(
     if keep_normalized not in ("max", "min"):
         raise Exception("'keep' must be either 'max' or 'min'.")
 
-    # 1) Resolve sheetId and title
-    spreadsheet = await asyncio.to_thread(
-        service.spreadsheets().get(spreadsheetId=spreadsheet_id).execute
-    )
-
-    sheets = spreadsheet.get("sheets", [])
-    if not sheets:
-        raise Exception(f"Spreadsheet {spreadsheet_id} has no sheets.")
-
-    def _norm(t: str) -> str:
-        return " ".join(t.split()).lower()
-
+    spreadsheets_api = service.spreadsheets()
+    sheets: List[Dict[str, Any]] = []
     target_sheet = None
-
-    # Prefer sheet_id if provided
+    headers: Optional[List[str]] = None
+    fresh_row_count: Optional[int] = None
+
+    # 1) Resolve sheetId and title.
+    # Fast path: a sheet_id or an exact sheet_name lets a single request return both
+    # the sheet properties and its header row (getByDataFilter selects row 1 by
+    # sheetId without knowing the title). Other selectors (a normalized name match,
+    # the single-sheet default) need the full sheet list below.
+    scoped_request = None
     if sheet_id is not None:
-        for s in sheets:
-            if s.get("properties", {}).get("sheetId") == sheet_id:
-                target_sheet = s
-                break
-        if target_sheet is None:
-            available = [(s.get("properties", {}).get("title", ""), s.get("properties", {}).get("sheetId")) for s in sheets]
-            raise Exception(f"sheet_id {sheet_id} not found. Available: {available}")
-    else:
-        # Try by sheet_name if provided
-        if sheet_name:
+        scoped_request = spreadsheets_api.getByDataFilter(
+            spreadsheetId=spreadsheet_id,
+            fields=_SHEET_WITH_HEADER_FIELDS,
+            body={
+                "dataFilters": [{"gridRange": {"sheetId": sheet_id, "startRowIndex": 0, "endRowIndex": 1}}],
+                "includeGridData": True,
+            },
+        )
+    elif sheet_name:
+        scoped_request = spreadsheets_api.get(
+            spreadsheetId=spreadsheet_id,
+            ranges=[f"{sheet_name}!1:1"],
+            includeGridData=True,
+            fields=_SHEET_WITH_HEADER_FIELDS,
+        )
+    if scoped_request is not None:
+        try:
+            scoped = await _execute_sheets(user_google_email, scoped_request)
+        except HttpError as e:
+            # 400 means the selector did not resolve to a sheet; resolve it below
+            if getattr(getattr(e, "resp", None), "status", None) != 400:
+                raise
+            scoped = {}
+        scoped_sheets = scoped.get("sheets", [])
+        if scoped_sheets:
+            scoped_properties = scoped_sheets[0].get("properties", {})
+            if (
+                scoped_properties.get("sheetId") == sheet_id
+                if sheet_id is not None
+                else scoped_properties.get("title") == sheet_name
+            ):
+                target_sheet = scoped_sheets[0]
+                headers = _header_row_from_grid(target_sheet)
+                fresh_row_count = scoped_properties.get("gridProperties", {}).get("rowCount")
+
+    if target_sheet is None:
+        # Fresh metadata: the sheet resolved here is the one rows get deleted from
+        spreadsheet = await _get_spreadsheet_metadata(service, user_google_email, spreadsheet_id, fresh=True)
+
+        sheets = spreadsheet.get("sheets", [])
+        if not sheets:
+            raise Exception(f"Spreadsheet {spreadsheet_id} has no sheets.")
+
+        def _norm(t: str) -> str:
+            return " ".join(t.split()).lower()
+
+        # Prefer sheet_id if provided
+        if sheet_id is not None:
             for s in sheets:
-                if s.get("properties", {}).get("title") == sheet_name:
+                if s.get("properties", {}).get("sheetId") == sheet_id:
                     target_sheet = s
                     break
             if target_sheet is None:
-                normalized_input = _norm(sheet_name)
-                candidates = [s for s in sheets if _norm(s.get("properties", {}).get("title", "")) == normalized_input]
-                if len(candidates) == 1:
-                    target_sheet = candidates[0]
-        # If still none, use only sheet if there is exactly one
-        if target_sheet is None:
-            if len(sheets) == 1:
-                target_sheet = sheets[0]
-            else:
                 available = [(s.get("properties", {}).get("title", ""), s.get("properties", {}).get("sheetId")) for s in sheets]
-                raise Exception(
-                    f"No sheet selector resolved. Provide 'sheet_id' or 'sheet_name'. Available: {available}"
-                )
+                raise Exception(f"sheet_id {sheet_id} not found. Available: {available}")
+        else:
+            # Try by sheet_name if provided
+            if sheet_name:
+                for s in sheets:
+                    if s.get("properties", {}).get("title") == sheet_name:
+                        target_sheet = s
+                        break
+                if target_sheet is None:
+                    normalized_input = _norm(sheet_name)
+                    candidates = [s for s in sheets if _norm(s.get("properties", {}).get("title", "")) == normalized_input]
+                    if len(candidates) == 1:
+                        target_sheet = candidates[0]
+            # If still none, use only sheet if there is exactly one
+            if target_sheet is None:
+                if len(sheets) == 1:
+                    target_sheet = sheets[0]
+                else:
+                    available = [(s.get("properties", {}).get("title", ""), s.get("properties", {}).get("sheetId")) for s in sheets]
+                    raise Exception(
+                        f"No sheet selector resolved. Provide 'sheet_id' or 'sheet_name'. Available: {available}"
+                    )
 
     effective_sheet_title = target_sheet.get("properties", {}).get("title")
     source_sheet_id = target_sheet.get("properties", {}).get("sheetId")
-    grid_props = target_sheet.get("properties", {}).get("gridProperties", {})
-    total_rows = grid_props.get("rowCount", 1000000)
-    total_cols = grid_props.get("columnCount", 26)
 
-    # 2) Read header row to map headers -> column indices
-    header_result = await asyncio.to_thread(
-        service.spreadsheets()
-        .values()
-        .get(spreadsheetId=spreadsheet_id, range=f"{effective_sheet_title}!1:1")
-        .execute
-    )
-    header_values = header_result.get("values", [])
-    headers: List[str] = header_values[0] if header_values else []
+    # 2) Read header row to map headers -> column indices (unless the fast path has it)
+    if headers is None:
+        header_result = await _execute_sheets(
+            user_google_email,
+            # Header names are matched as strings, so the default FORMATTED_VALUE
+            # rendering is kept; the fields mask drops range/majorDimension metadata.
+            spreadsheets_api.values().get(
+                spreadsheetId=spreadsheet_id, range=f"{effective_sheet_title}!1:1", fields="values"
+            )
+        )
+        header_values = header_result.get("values", [])
+        headers = header_values[0] if header_values else []
     if not headers:
         raise Exception("Header row (row 1) is empty; cannot map header names to columns.")
 
+    header_index: Dict[str, int] = {}
+    for idx, name in enumerate(headers):
+        header_index.setdefault(name, idx)  # first occurrence wins, like list.index
+
     def header_to_col_index_or_raise(header_name: str) -> int:
-        try:
-            return headers.index(header_name)
-        except ValueError:
+        col_index = header_index.get(header_name)
+        if col_index is None:
             raise Exception(f"Header '{header_name}' not found in sheet '{effective_sheet_title}'.")
+        return col_index
 
     sort_col_index = header_to_col_index_or_raise(sort_header)
     key_col_indices = [header_to_col_index_or_raise(h) for h in key_headers_list]
 
+    # A grid holding only the header row leaves nothing to sort or delete. Only a row
+    # count read just now is trusted; cached metadata may predate added rows.
+    if not work_on_copy and fresh_row_count is not None and fresh_row_count <= 1:
+        return f"Sheet '{effective_sheet_title}' has no data rows below the header; nothing to deduplicate."
+
     # 3) Prepare optional duplicate sheet step
     effective_sheet_id = source_sheet_id
-    requests: List[Dict[str, Any]] = []
+    target_title = (
+        (destination_sheet_name or f"{effective_sheet_title} (dedup)") if work_on_copy else effective_sheet_title
+    )
+    copy_requests: List[Dict[str, Any]] = []
 
     if work_on_copy:
-        requests.append(
+        # Choose the copy's sheetId up front so the duplicate, sort and delete can
+        # all go in one batchUpdate. The batch is atomic, so in the unlikely event
+        # the ID collides with a sheet added since the metadata read, nothing is applied.
+        # The fast path above has no sheet list, so fall back to cached metadata.
+        known_sheets = sheets or _SPREADSHEET_METADATA_CACHE.get(
+            (user_google_email, spreadsheet_id), {}
+        ).get("sheets", [])
+        existing_sheet_ids = {s.get("properties", {}).get("sheetId") for s in known_sheets}
+        existing_sheet_ids.add(source_sheet_id)
+        effective_sheet_id = random.randint(1, 2**31 - 1)
+        while effective_sheet_id in existing_sheet_ids:
+            effective_sheet_id = random.randint(1, 2**31 - 1)
+
+        copy_requests.append(
             {
                 "duplicateSheet": {
                     "sourceSheetId": source_sheet_id,
                     "insertSheetIndex": 0,
-                    "newSheetName": destination_sheet_name or f"{effective_sheet_title} (dedup)"
+                    "newSheetId": effective_sheet_id,
+                    "newSheetName": target_title
                 }
             }
         )
 
-        # Execute duplication first to obtain new sheet id
-        dup_response = await asyncio.to_thread(
-            service.spreadsheets()
-            .batchUpdate(
-                spreadsheetId=spreadsheet_id,
-                body={"requests": requests}
-            )
-            .execute
-        )
-        requests = []
-
-        replies = dup_response.get("replies", [])
-        if not replies or "duplicateSheet" not in replies[0]:
-            raise Exception("Failed to duplicate sheet before deduplication.")
-        effective_sheet_id = replies[0]["duplicateSheet"]["properties"]["sheetId"]
-
     # 4) Build sort then delete-duplicates requests applied to data rows (exclude header)
     sort_order = "DESCENDING" if keep_normalized == "max" else "ASCENDING"
 
+    # End indexes are omitted so the range is unbounded and always covers the
+    # whole grid, even if the (possibly cached) metadata predates added rows.
     data_range = {
         "sheetId": effective_sheet_id,
         "startRowIndex": 1,  # exclude header row
         "startColumnIndex": 0,
-        "endRowIndex": total_rows,
-        "endColumnIndex": total_cols,
     }
 
-    requests.append(
-        {
-            "sortRange": {
-                "range": data_range,
-                "sortSpecs": [
-                    {"dimensionIndex": sort_col_index, "sortOrder": sort_order}
-                ],
-            }
-        }
-    )
-
     comparison_columns = [
         {
             "sheetId": effective_sheet_id,
@@ -1656,6 +2237,19 @@ async def deduplicate_rows_by_headers(
         for idx in key_col_indices
     ]
 
+    requests: List[Dict[str, Any]] = list(copy_requests)
+    # Sorting on a key column cannot change which duplicate comes first
+    if sort_col_index not in key_col_indices:
+        requests.append(
+            {
+                "sortRange": {
+                    "range": data_range,
+                    "sortSpecs": [
+                        {"dimensionIndex": sort_col_index, "sortOrder": sort_order}
+                    ],
+                }
+            }
+        )
     requests.append(
         {
             "deleteDuplicates": {
@@ -1665,13 +2259,19 @@ async def deduplicate_rows_by_headers(
         }
     )
 
-    _ = await asyncio.to_thread(
-        service.spreadsheets()
-        .batchUpdate(spreadsheetId=spreadsheet_id, body={"requests": requests})
-        .execute
+    # Sent on its own rather than merged with other calls (see _coalesced_batch_update):
+    # row deletion is destructive, so it should only ever be applied atomically with this
+    # call's own sort. Sort + deleteDuplicates can be replayed safely after a 5xx;
+    # duplicateSheet can't, since a retry of a copy that already landed would fail on the
+    # taken sheet ID.
+    await _execute_sheets(
+        user_google_email,
+        _batch_update_request(service, spreadsheet_id, requests),
+        idempotent=not work_on_copy,
     )
+    # A copy adds a sheet, and deleted duplicate rows shrink the grid
+    _invalidate_spreadsheet_metadata(user_google_email, spreadsheet_id)
 
-    target_title = effective_sheet_title if not work_on_copy else (destination_sheet_name or f"{effective_sheet_title} (dedup)")
     return (
         f"Deduplicated sheet '{target_title}' by keys {key_headers_list}, keeping {keep_normalized} of '{sort_header}'."
     )
@@ -1767,10 +2367,13 @@ async def add_chart(
     if data_rows < (2 if has_header else 1):
         raise Exception("'data_rows' must contain at least one data row (plus header if has_header=True).")
 
-    spreadsheet = await asyncio.to_thread(
-        service.spreadsheets().get(spreadsheetId=spreadsheet_id).execute
-    )
-    sheet_id = _resolve_sheet_id_by_name(spreadsheet, sheet_name)
+    spreadsheet = await _get_spreadsheet_metadata(service, user_google_email, spreadsheet_id)
+    try:
+        sheet_id = _resolve_sheet_id_by_name(spreadsheet, sheet_name)
+    except Exception:
+        # The cached sheet list may predate a sheet added or renamed elsewhere
+        spreadsheet = await _get_spreadsheet_metadata(service, user_google_email, spreadsheet_id, fresh=True)
+        sheet_id = _resolve_sheet_id_by_name(spreadsheet, sheet_name)
 
     end_row_index = start_row_index + data_rows
     end_column_index = start_column_index + data_columns
@@ -1867,10 +2470,9 @@ async def add_chart(
         }
     }
 
-    response = await asyncio.to_thread(
-        service.spreadsheets()
-        .batchUpdate(spreadsheetId=spreadsheet_id, body={"requests": [add_chart_request]})
-        .execute
+    response = await _execute_sheets(
+        user_google_email,
+        _batch_update_request(service, spreadsheet_id, [add_chart_request])
     )
 
     replies = response.get("replies", [])
@@ -29,6 +29,11 @@ from googleapiclient.errors import HttpError
 from auth.service_decorator import require_multiple_services
 from core.server import server
 from core.utils import handle_http_errors
+from gdrive.drive_helpers import (
+    find_or_create_folder_path,
+    move_file_to_folder,
+    move_file_to_folder_path,
+)
 
 from gslides import _builders as B
 
@@ -798,7 +803,6 @@ async def _create_data_sheet_and_charts(
 
     # Move the data sheet next to the deck if a target folder was resolved.
     if target_folder_id:
-        from gdrive.drive_helpers import move_file_to_folder
 
         await move_file_to_folder(
             drive_service, spreadsheet_id, target_folder_id, file_name=f"{title} - data"
@@ -1539,14 +1543,15 @@ async def create_audit_presentation(
     # 1) Resolve target folder (if any) BEFORE the copy so we can do `if_exists` checks.
     target_folder_id = folder_id
     folder_path_summary = ""
+    folder_result = None
     if folder_path and not folder_id:
-        from gdrive.drive_helpers import find_or_create_folder_path
 
         folder_result = await find_or_create_folder_path(
             drive_service,
             folder_path,
             root_folder_id=None,
             create_missing=create_folders_if_missing,
+            user_email=user_google_email,
         )
         if folder_result:
             target_folder_id = folder_result["id"]
@@ -1603,12 +1608,38 @@ async def create_audit_presentation(
 
     data_sheet_meta: Optional[Dict[str, Any]] = None
     try:
-        # 4) Move the deck into the target folder (if any).
-        if target_folder_id:
-            from gdrive.drive_helpers import move_file_to_folder
+        # 4) Move the deck into the target folder (if any). A folder_path result may
+        #    come from the path cache, so that move re-resolves the path if it fails.
+        if folder_result:
+
+            folder_result = await move_file_to_folder_path(
+                drive_service,
+                presentation_id,
+                folder_path,
+                create_missing=create_folders_if_missing,
+                user_email=user_google_email,
+                file_name=final_title,
+                resolved_folder=folder_result,
+                known_previous_parents=new_file.get("parents"),
+            )
+            if folder_result:
+                target_folder_id = folder_result["id"]
+                folder_path_summary = folder_result["path_summary"]
+            else:
+                logger.warning(
+                    f"[create_audit_presentation] Could not move the deck into folder_path "
+                    f"{' > '.join(folder_path)}; deck stays in My Drive."
+                )
+                target_folder_id = None
+                folder_path_summary = ""
+        elif target_folder_id:
 
             await move_file_to_folder(
-                drive_service, presentation_id, target_folder_id, file_name=final_title
+                drive_service,
+                presentation_id,
+                target_folder_id,
+                file_name=final_title,
+                known_previous_parents=new_file.get("parents"),
             )
 
         # 5) Either wipe the template's slides (clean canvas) or keep them (boilerplate mode).
@@ -6,16 +6,88 @@ This module provides MCP tools for interacting with Google Slides API.
 
 import logging
 import asyncio
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 
+from cachetools import TTLCache
 
 from auth.service_decorator import require_google_service, require_multiple_services
 from core.server import server
 from core.utils import handle_http_errors
 from core.comments import create_comment_tools
+from gdrive.drive_helpers import (
+    find_folder_by_name_pattern,
+    move_file_to_folder,
+    move_file_to_folder_path,
+)
 
 logger = logging.getLogger(__name__)
 
+# Partial-response masks for presentations.get in get_presentation: only the text runs
+# of shapes, tables and speaker notes, instead of every element's layout and styling
+_TEXT_BODY_FIELDS = "text(textElements(textRun(content)))"
+_SLIDE_TEXT_FIELDS = (
+    f"pageElements(shape({_TEXT_BODY_FIELDS}),"
+    f"table(rows,columns,tableRows(tableCells({_TEXT_BODY_FIELDS}))))"
+)
+_SLIDE_NOTES_FIELDS = f"slideProperties(notesPage(pageElements(shape({_TEXT_BODY_FIELDS}))))"
+
+# pages.get results keyed by (user_email, presentation_id, page_object_id), and thumbnail
+# content URLs keyed by (user_email, presentation_id, page_object_id, size). Short-lived:
+# batch_update_presentation drops every entry for the presentation it edits, but edits
+# made elsewhere (Slides UI, other clients) only show up once an entry expires. Thumbnail
+# URLs are kept for a small fraction of their ~30 minute lifetime, so a cached URL is
+# still valid for a good while after it is returned.
+_PAGE_CACHE: "TTLCache[Tuple[str, str, str], Dict[str, Any]]" = TTLCache(maxsize=256, ttl=60)
+_THUMBNAIL_URL_CACHE: "TTLCache[Tuple[str, str, str, str], str]" = TTLCache(maxsize=256, ttl=120)
+
+# Pages per batch HTTP request in get_presentation_thumbnails
+_THUMBNAIL_BATCH_SIZE = 50
+
+
+def _invalidate_presentation_cache(user_google_email: str, presentation_id: str) -> None:
+    """Drop cached pages and thumbnail URLs for a presentation after it has been edited."""
+    for cache in (_PAGE_CACHE, _THUMBNAIL_URL_CACHE):
+        for key in [k for k in cache.keys() if k[0] == user_google_email and k[1] == presentation_id]:
+            cache.pop(key, None)
+
+
+def _text_runs(text: Optional[Dict[str, Any]]) -> str:
+    """Concatenate the textRun contents of a Slides text body (shape or table cell)."""
+    if not text:
+        return ''
+    return ''.join([
+        tr['content']
+        for te in text.get('textElements') or ()
+        if 'content' in (tr := te.get('textRun') or ())
+    ])
+
+
+def _shape_text(shape: Optional[Dict[str, Any]]) -> str:
+    """Visible text of a shape, stripped."""
+    return _text_runs((shape or {}).get('text')).strip()
+
+
+def _table_text(table: Dict[str, Any]) -> str:
+    """Table text as one ' | '-joined line per row."""
+    cell_text_parts = []
+    for row in table.get('tableRows') or ():
+        row_parts = [_text_runs(cell.get('text')).strip() for cell in row.get('tableCells') or ()]
+        if row_parts:
+            cell_text_parts.append(' | '.join(row_parts))
+    # Fallback if the tableRows structure is not present
+    rows = table.get('rows', 0)
+    cols = table.get('columns', 0)
+    if not cell_text_parts and rows and cols:
+        cell_text_parts.append(f"[{rows}x{cols} table content not parsed]")
+    return '\n'.join(cell_text_parts).strip()
+
+
+def _truncate(text: str, limit: int) -> str:
+    """Cut text to limit characters with a marker; a limit of 0 disables the cap."""
+    if limit and len(text) > limit:
+        return text[:limit] + "\n[...truncated...]"
+    return text
+
 
 @server.tool()
 @handle_http_errors("create_presentation", service_type="slides")
@@ -68,22 +140,22 @@ async def create_presentation(
     
     # Priority 1: folder_path (navigate through nested folders)
     if folder_path and not folder_id:
-        from gdrive.drive_helpers import find_or_create_folder_path
-        folder_result = await find_or_create_folder_path(
+        folder_result = await move_file_to_folder_path(
             drive_service,
+            presentation_id,
             folder_path,
             root_folder_id=search_within_folder_id,
-            create_missing=create_folders_if_missing
+            create_missing=create_folders_if_missing,
+            user_email=user_google_email,
+            file_name=title
         )
         if folder_result:
-            target_folder_id = folder_result['id']
             folder_info = f"\n- Path: {folder_result['path_summary']}"
         else:
             folder_info = f"\n- Warning: Could not navigate folder path {' > '.join(folder_path)}, created in My Drive"
     
     # Priority 2: folder_name_contains (simple search)
     elif folder_name_contains and not folder_id:
-        from gdrive.drive_helpers import find_folder_by_name_pattern
         folder = await find_folder_by_name_pattern(
             drive_service,
             folder_name_contains,
@@ -100,7 +172,6 @@ async def create_presentation(
             folder_info = f"\n- Warning: No folder found matching '{folder_name_contains}'{search_scope}, created in My Drive"
     
     if target_folder_id:
-        from gdrive.drive_helpers import move_file_to_folder
         move_success = await move_file_to_folder(
             drive_service,
             presentation_id,
@@ -148,121 +219,94 @@ async def get_presentation(
     """
     logger.info(f"[get_presentation] Invoked. Email: '{user_google_email}', ID: '{presentation_id}'")
 
+    # Request only what the summary and text extraction below read
+    slide_fields = ["objectId"]
+    if include_text:
+        slide_fields.append(_SLIDE_TEXT_FIELDS)
+    if include_notes:
+        slide_fields.append(_SLIDE_NOTES_FIELDS)
     presentation = await asyncio.to_thread(
-        service.presentations().get(presentationId=presentation_id).execute
+        service.presentations().get(
+            presentationId=presentation_id,
+            fields=f"title,pageSize,slides({','.join(slide_fields)})",
+        ).execute
     )
 
     title = presentation.get('title', 'Untitled')
     slides = presentation.get('slides', [])
     page_size = presentation.get('pageSize', {})
 
-    def extract_text_from_text_elements(text_elements: list[dict]) -> str:
-        lines = []
-        for te in text_elements or []:
-            text_run = te.get('textRun')
-            if text_run:
-                content = text_run.get('content', '')
-                if content:
-                    lines.append(content)
-        return ''.join(lines)
-
-    def extract_shape_text(shape: dict) -> str:
-        text_content = []
-        text = (shape or {}).get('text', {})
-        for pe in text.get('textElements', []) or []:
-            tr = pe.get('textRun')
-            if tr and 'content' in tr:
-                text_content.append(tr['content'])
-        return ''.join(text_content).strip()
-
-    def extract_table_text(table: dict) -> str:
-        cell_text_parts = []
-        rows = table.get('rows', 0)
-        cols = table.get('columns', 0)
-        table_cells = table.get('tableRows', []) or []
-        # Some APIs expose rows via tableRows, others via a grid-like structure
-        for row in table_cells:
-            cells = row.get('tableCells', []) or []
-            row_parts = []
-            for cell in cells:
-                cell_text = []
-                for ce in cell.get('text', {}).get('textElements', []) or []:
-                    tr = ce.get('textRun')
-                    if tr and 'content' in tr:
-                        cell_text.append(tr['content'])
-                row_parts.append(''.join(cell_text).strip())
-            if row_parts:
-                cell_text_parts.append(' | '.join(row_parts))
-        # Fallback if above structure not present
-        if not cell_text_parts and rows and cols:
-            cell_text_parts.append(f"[{rows}x{cols} table content not parsed]")
-        return '\n'.join(cell_text_parts).strip()
-
-    def truncate(text: str, limit: int) -> str:
-        if limit and len(text) > limit:
-            return text[:limit] + "\n[...truncated...]"
-        return text
-
     slide_outputs = []
     total_slides = len(slides)
     process_count = min(total_slides, max_slides) if max_slides else total_slides
 
-    for index, slide in enumerate(slides[:process_count], start=1):
-        slide_id = slide.get('objectId', 'Unknown')
-        elements = slide.get('pageElements', []) or []
-
-        visible_text_parts = []
-        if include_text:
-            for el in elements:
-                if 'shape' in el:
-                    text_value = extract_shape_text(el.get('shape', {}))
-                    if text_value:
-                        visible_text_parts.append(text_value)
-                elif 'table' in el:
-                    table_text = extract_table_text(el.get('table', {}))
-                    if table_text:
-                        visible_text_parts.append(table_text)
-
-        notes_text = ''
-        if include_notes:
-            notes_page = slide.get('slideProperties', {}).get('notesPage') or slide.get('notesPage')
-            if not notes_page:
-                # Some API responses nest notes at top-level of slide
-                notes_page = slide.get('notesPage')
-            if notes_page:
-                # The notes page contains a shape with the notes content
-                notes_elements = (notes_page.get('notesProperties', {}) or {}).get('speakerNotesObjectId')
-                # More robustly iterate all page elements of notesPage
-                for npe in (notes_page.get('pageElements') or []):
-                    shape = npe.get('shape')
-                    if shape:
-                        candidate = extract_shape_text(shape)
-                        if candidate:
-                            notes_text += candidate
-                notes_text = notes_text.strip()
-
-        slide_text = ''
-        if visible_text_parts:
-            slide_text += ("\n".join(visible_text_parts)).strip()
-        if notes_text:
-            slide_text += ("\n\n--- SPEAKER NOTES ---\n" + notes_text)
-
-        slide_text = truncate(slide_text, max_chars_per_slide) if slide_text else ''
-
-        # Build section output for this slide
-        header = f"Slide {index}/{total_slides} (ID: {slide_id})"
-        if slide_text:
-            slide_outputs.append(f"{header}\n{slide_text}")
-        else:
-            slide_outputs.append(f"{header}\n[No extractable text]")
+    if not include_text and not include_notes:
+        # Nothing to extract: list the slides without walking their (absent) content
+        slide_outputs = [
+            f"Slide {index}/{total_slides} (ID: {slide.get('objectId', 'Unknown')})\n[No extractable text]"
+            for index, slide in enumerate(slides[:process_count], start=1)
+        ]
+    else:
+        for index, slide in enumerate(slides[:process_count], start=1):
+            slide_id = slide.get('objectId', 'Unknown')
+            elements = slide.get('pageElements', []) or []
+
+            visible_text_parts = []
+            # Length of the newline-joined visible text. Once it passes the per-slide cap,
+            # everything after it would be truncated away, so extraction stops there.
+            visible_len = -1
+            if include_text:
+                for el in elements:
+                    if 'shape' in el:
+                        text_value = _shape_text(el.get('shape', {}))
+                        if text_value:
+                            visible_text_parts.append(text_value)
+                            visible_len += len(text_value) + 1
+                    elif 'table' in el:
+                        table_text = _table_text(el.get('table', {}))
+                        if table_text:
+                            visible_text_parts.append(table_text)
+                            visible_len += len(table_text) + 1
+                    if 0 < max_chars_per_slide < visible_len:
+                        break
+            over_limit = 0 < max_chars_per_slide < visible_len
+
+            notes_text = ''
+            if include_notes and not over_limit:
+                notes_page = slide.get('slideProperties', {}).get('notesPage')
+                if notes_page:
+                    # Rather than only the speakerNotesObjectId shape, take the text of
+                    # every shape on the notes page
+                    notes_text = ''.join([
+                        _shape_text(npe['shape'])
+                        for npe in notes_page.get('pageElements') or ()
+                        if npe.get('shape')
+                    ]).strip()
+
+            slide_text = ''
+            if visible_text_parts:
+                slide_text += ("\n".join(visible_text_parts)).strip()
+            if notes_text:
+                slide_text += ("\n\n--- SPEAKER NOTES ---\n" + notes_text)
+
+            slide_text = _truncate(slide_text, max_chars_per_slide) if slide_text else ''
+
+            # Build section output for this slide
+            header = f"Slide {index}/{total_slides} (ID: {slide_id})"
+            if slide_text:
+                slide_outputs.append(f"{header}\n{slide_text}")
+            else:
+                slide_outputs.append(f"{header}\n[No extractable text]")
 
+    width = page_size.get('width') or {}
+    height = page_size.get('height') or {}
     summary_header = (
         f"Presentation Details for {user_google_email}:\n"
         f"- Title: {title}\n"
         f"- Presentation ID: {presentation_id}\n"
         f"- URL: https://docs.google.com/presentation/d/{presentation_id}/edit\n"
         f"- Total Slides: {len(slides)}\n"
-        f"- Page Size: {page_size.get('width', {}).get('magnitude', 'Unknown')} x {page_size.get('height', {}).get('magnitude', 'Unknown')} {page_size.get('width', {}).get('unit', '')}\n"
+        f"- Page Size: {width.get('magnitude', 'Unknown')} x {height.get('magnitude', 'Unknown')} {width.get('unit', '')}\n"
     )
 
     content_intro = "\n--- CONTENT (first {n} slides) ---\n".format(n=process_count)
@@ -304,6 +348,7 @@ async def batch_update_presentation(
             body=body
         ).execute
     )
+    _invalidate_presentation_cache(user_google_email, presentation_id)
 
     replies = result.get('replies', [])
 
@@ -314,16 +359,17 @@ async def batch_update_presentation(
 - Replies Received: {len(replies)}"""
 
     if replies:
-        confirmation_message += "\n\nUpdate Results:"
+        result_lines = ["\n\nUpdate Results:"]
         for i, reply in enumerate(replies, 1):
             if 'createSlide' in reply:
                 slide_id = reply['createSlide'].get('objectId', 'Unknown')
-                confirmation_message += f"\n  Request {i}: Created slide with ID {slide_id}"
+                result_lines.append(f"\n  Request {i}: Created slide with ID {slide_id}")
             elif 'createShape' in reply:
                 shape_id = reply['createShape'].get('objectId', 'Unknown')
-                confirmation_message += f"\n  Request {i}: Created shape with ID {shape_id}"
+                result_lines.append(f"\n  Request {i}: Created shape with ID {shape_id}")
             else:
-                confirmation_message += f"\n  Request {i}: Operation completed"
+                result_lines.append(f"\n  Request {i}: Operation completed")
+        confirmation_message += ''.join(result_lines)
 
     logger.info(f"Batch update completed successfully for {user_google_email}")
     return confirmation_message
@@ -341,6 +387,9 @@ async def get_page(
     """
     Get details about a specific page (slide) in a presentation.
 
+    Results are cached for up to 60 seconds; edits made outside this server within
+    that window may not be reflected yet.
+
     Args:
         user_google_email (str): The user's Google email address. Required.
         presentation_id (str): The ID of the presentation.
@@ -351,12 +400,16 @@ async def get_page(
     """
     logger.info(f"[get_page] Invoked. Email: '{user_google_email}', Presentation: '{presentation_id}', Page: '{page_object_id}'")
 
-    result = await asyncio.to_thread(
-        service.presentations().pages().get(
-            presentationId=presentation_id,
-            pageObjectId=page_object_id
-        ).execute
-    )
+    cache_key = (user_google_email, presentation_id, page_object_id)
+    result = _PAGE_CACHE.get(cache_key)
+    if result is None:
+        result = await asyncio.to_thread(
+            service.presentations().pages().get(
+                presentationId=presentation_id,
+                pageObjectId=page_object_id
+            ).execute
+        )
+        _PAGE_CACHE[cache_key] = result
 
     page_type = result.get('pageType', 'Unknown')
     page_elements = result.get('pageElements', [])
@@ -404,6 +457,9 @@ async def get_page_thumbnail(
     """
     Generate a thumbnail URL for a specific page (slide) in a presentation.
 
+    URLs are cached for up to 2 minutes; edits made outside this server within that
+    window may not be reflected in the thumbnail yet.
+
     Args:
         user_google_email (str): The user's Google email address. Required.
         presentation_id (str): The ID of the presentation.
@@ -415,16 +471,20 @@ async def get_page_thumbnail(
     """
     logger.info(f"[get_page_thumbnail] Invoked. Email: '{user_google_email}', Presentation: '{presentation_id}', Page: '{page_object_id}', Size: '{thumbnail_size}'")
 
-    result = await asyncio.to_thread(
-        service.presentations().pages().getThumbnail(
-            presentationId=presentation_id,
-            pageObjectId=page_object_id,
-            thumbnailProperties_thumbnailSize=thumbnail_size,
-            thumbnailProperties_mimeType='PNG'
-        ).execute
-    )
-
-    thumbnail_url = result.get('contentUrl', '')
+    cache_key = (user_google_email, presentation_id, page_object_id, thumbnail_size)
+    thumbnail_url = _THUMBNAIL_URL_CACHE.get(cache_key)
+    if thumbnail_url is None:
+        result = await asyncio.to_thread(
+            service.presentations().pages().getThumbnail(
+                presentationId=presentation_id,
+                pageObjectId=page_object_id,
+                thumbnailProperties_thumbnailSize=thumbnail_size,
+                thumbnailProperties_mimeType='PNG'
+            ).execute
+        )
+        thumbnail_url = result.get('contentUrl', '')
+        if thumbnail_url:
+            _THUMBNAIL_URL_CACHE[cache_key] = thumbnail_url
 
     confirmation_message = f"""Thumbnail Generated for {user_google_email}:
 - Presentation ID: {presentation_id}
@@ -438,6 +498,95 @@ You can view or download the thumbnail using the provided URL."""
     return confirmation_message
 
 
+@server.tool()
+@handle_http_errors("get_presentation_thumbnails", is_read_only=True, service_type="slides")
+@require_google_service("slides", "slides_read")
+async def get_presentation_thumbnails(
+    service,
+    user_google_email: str,
+    presentation_id: str,
+    page_object_ids: Optional[List[str]] = None,
+    thumbnail_size: str = "MEDIUM"
+) -> str:
+    """
+    Generate thumbnail URLs for several pages (slides) of a presentation at once.
+
+    URLs are cached for up to 2 minutes (shared with get_page_thumbnail); edits made
+    outside this server within that window may not be reflected in the thumbnails yet.
+
+    Args:
+        user_google_email (str): The user's Google email address. Required.
+        presentation_id (str): The ID of the presentation.
+        page_object_ids (Optional[List[str]]): Object IDs of the pages/slides. Defaults to every slide.
+        thumbnail_size (str): Size of thumbnails ("LARGE", "MEDIUM", "SMALL"). Defaults to "MEDIUM".
+
+    Returns:
+        str: Thumbnail URL for each page, in order. Pages that failed are reported inline.
+    """
+    logger.info(f"[get_presentation_thumbnails] Invoked. Email: '{user_google_email}', Presentation: '{presentation_id}', Pages: {page_object_ids}, Size: '{thumbnail_size}'")
+
+    if page_object_ids is None:
+        presentation = await asyncio.to_thread(
+            service.presentations().get(
+                presentationId=presentation_id,
+                fields="slides(objectId)"
+            ).execute
+        )
+        page_object_ids = [slide['objectId'] for slide in presentation.get('slides', [])]
+
+    urls: Dict[str, str] = {}
+    errors: Dict[str, Exception] = {}
+    missing = []
+    for page_object_id in dict.fromkeys(page_object_ids):
+        cached_url = _THUMBNAIL_URL_CACHE.get((user_google_email, presentation_id, page_object_id, thumbnail_size))
+        if cached_url is None:
+            missing.append(page_object_id)
+        else:
+            urls[page_object_id] = cached_url
+
+    def _callback(request_id, response, exception):
+        if exception is not None:
+            errors[request_id] = exception
+        else:
+            urls[request_id] = response.get('contentUrl', '')
+
+    # All thumbnail requests share one batch HTTP request per _THUMBNAIL_BATCH_SIZE pages
+    for start in range(0, len(missing), _THUMBNAIL_BATCH_SIZE):
+        batch = service.new_batch_http_request(callback=_callback)
+        for page_object_id in missing[start:start + _THUMBNAIL_BATCH_SIZE]:
+            batch.add(
+                service.presentations().pages().getThumbnail(
+                    presentationId=presentation_id,
+                    pageObjectId=page_object_id,
+                    thumbnailProperties_thumbnailSize=thumbnail_size,
+                    thumbnailProperties_mimeType='PNG'
+                ),
+                request_id=page_object_id
+            )
+        await asyncio.to_thread(batch.execute)
+
+    for page_object_id in missing:
+        if urls.get(page_object_id):
+            _THUMBNAIL_URL_CACHE[(user_google_email, presentation_id, page_object_id, thumbnail_size)] = urls[page_object_id]
+
+    lines = []
+    for page_object_id in page_object_ids:
+        if page_object_id in errors:
+            lines.append(f"- Page {page_object_id}: Error generating thumbnail: {errors[page_object_id]}")
+        else:
+            lines.append(f"- Page {page_object_id}: {urls.get(page_object_id, '')}")
+
+    confirmation_message = f"""Thumbnails Generated for {user_google_email}:
+- Presentation ID: {presentation_id}
+- Thumbnail Size: {thumbnail_size}
+- Pages: {len(page_object_ids)}
+
+{chr(10).join(lines) if lines else 'No pages found'}"""
+
+    logger.info(f"Generated {len(page_object_ids) - len(errors)}/{len(page_object_ids)} thumbnails for {user_google_email}")
+    return confirmation_message
+
+
 # Create comment management tools for slides
 _comment_tools = create_comment_tools("presentation", "presentation_id")
 read_presentation_comments = _comment_tools['read_comments']